@@ -8,6 +8,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.analysis.analyzer import analyze_video
+from src.analysis.feedback import format_feedback_numbered_str
 
 def main():
     # Test video path - replace with your actual video
@@ -41,8 +42,7 @@ def main():
     print("FEEDBACK")
     print("-"*60)
     if form.feedback_summary:
-        for i, feedback in enumerate(form.feedback_summary, 1):
-            print(f"{i}. {feedback}")
+        print(format_feedback_numbered_str(form.feedback_summary))
     else:
         print("No issues found - excellent form!")
 
@@ -51,7 +51,7 @@ def main():
     print("-"*60)
     for violation in form.violations:
         status = "PASSED" if violation.passed else "FAILED"
-        print(f"{status} [{violation.severity.value.upper()}] {violation.rule_name}")
+        print(f"{status} [{violation.severity.name}] {violation.rule_name}")
         print(f"   {violation.feedback}")
         if violation.details:
             print(f"   Details: {violation.details}")
@@ -2,10 +2,22 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath('.'))
 
+import atexit
+import functools
+
 import cv2
+import numpy as np
 from src.pose.detector import PoseDetector
 
 
+@functools.lru_cache(maxsize=1)
+def _get_detector():
+    """Build the shared PoseDetector once and close it on exit."""
+    detector = PoseDetector(min_detection_confidence=0.5)
+    atexit.register(detector.close)
+    return detector
+
+
 def test_image():
     """Test pose detection on a single image."""
     print("Testing PoseDetector on image...")
@@ -19,13 +31,13 @@ def test_image():
     # Convert BGR to RGB (OpenCV loads as BGR)
     image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
-    # Create detector and detect pose
-    detector = PoseDetector()
-    landmarks = detector.detect(image_rgb)
+    # Detect pose
+    result = _get_detector().detect(image_rgb)
 
-    if landmarks:
+    if result is not None:
+        landmarks = result.landmarks
         print(f"Detected {len(landmarks)} landmarks")
-        print(f"   First landmark (nose): x={landmarks[0].x:.3f}, y={landmarks[0].y:.3f}")
+        print(f"   First landmark (nose): x={landmarks[0, 0]:.3f}, y={landmarks[0, 1]:.3f}")
         return True
     else:
         print("No pose detected")
@@ -41,23 +53,27 @@ def test_video():
     if not cap.isOpened():
         print("Could not open video")
         return False
+    # Keep at most one frame queued (only takes effect on camera streams)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
-    # Create detector
-    detector = PoseDetector(min_detection_confidence=0.5)
+    # Reuse the detector built for the image test
+    detector = _get_detector()
 
     # Test first 10 frames
     detected_count = 0
+    frame_rgb = None
     for i in range(10):
         success, frame = cap.read()
         if not success:
             break
 
-        # Convert BGR to RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Convert BGR to RGB into a buffer reused across frames
+        if frame_rgb is None:
+            frame_rgb = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame_rgb)
 
         # Detect pose
-        landmarks = detector.detect(frame_rgb)
-        if landmarks:
+        if detector.detect(frame_rgb) is not None:
             detected_count += 1
 
     cap.release()
@@ -2,15 +2,30 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath('.'))
 
+from queue import Queue
+from threading import Event, Thread
+
 import mediapipe as mp
 import cv2
 import numpy as np
+import matplotlib
+
+# --headless: no preview window, save the angle plot instead of showing it
+HEADLESS = '--headless' in sys.argv
+if HEADLESS:
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-from src.features.geometry import calculate_angle
+from src.features.geometry import calculate_angles_batch, calculate_vertical_angles_batch
 
-class Point:
-    def __init__(self, x, y, z):
-        self.x, self.y, self.z = x, y, z
+# MediaPipe landmark indices (right side)
+RIGHT_SHOULDER_IDX = 12
+RIGHT_HIP_IDX = 24
+RIGHT_KNEE_IDX = 26
+RIGHT_ANKLE_IDX = 28
+RIGHT_TOE_IDX = 32
+# gather order: hip, knee, ankle, shoulder, toe
+JOINT_IDXS = np.array([RIGHT_HIP_IDX, RIGHT_KNEE_IDX, RIGHT_ANKLE_IDX,
+                       RIGHT_SHOULDER_IDX, RIGHT_TOE_IDX])
 
 mp_pose = mp.solutions.pose
 mp_drawing = mp.solutions.drawing_utils
@@ -21,57 +36,77 @@ cap = cv2.VideoCapture('data/videos/good_form/squat.mp4')
 if not cap.isOpened():
     print("Error opening video")
     exit()
+# keep at most one frame queued (only takes effect on camera streams)
+cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+# decode frames on a worker thread so decoding overlaps with inference
+QUEUE_SIZE = 4
+frame_queue = Queue(maxsize=QUEUE_SIZE)
+stop_decoding = Event()
+
+# reusable RGB buffers: one per queued frame, plus the one being processed
+# by the main thread and the one being filled by the decoder
+width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+# read before the decoder thread starts calling cap.read()
+n_frames = max(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)), 1)
+rgb_bufs = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(QUEUE_SIZE + 2)]
+
+def decode_frames():
+    buf_idx = 0
+    while not stop_decoding.is_set():
+        success, image = cap.read()
+        if not success:
+            break
+        # keep the BGR frame for drawing alongside the RGB copy for MediaPipe
+        image_rgb = rgb_bufs[buf_idx]
+        if image_rgb.shape != image.shape:
+            image_rgb = rgb_bufs[buf_idx] = np.empty_like(image)
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image_rgb)
+        buf_idx = (buf_idx + 1) % len(rgb_bufs)
+        frame_queue.put((image, image_rgb))
+    # None marks the end of the stream
+    frame_queue.put(None)
+
+decoder = Thread(target=decode_frames, daemon=True)
+decoder.start()
 
 with mp_pose.Pose(
     min_detection_confidence=0.5,
     min_tracking_confidence=0.5) as pose:
     
     frame = 0;
-    knee_angles = []
-    hip_angles = []
-    ankle_angles = []
-    back_angles = []
-    while cap.isOpened():
-        success, image = cap.read()
-        if not success:
+    # per-frame (hip, knee, ankle, shoulder, toe) coordinates, NaN = no pose
+    joint_coords = np.full((n_frames, 5, 3), np.nan, dtype=np.float32)
+    while True:
+        item = frame_queue.get()
+        if item is None:
             print("Ignoring empty camera frame.")
             break
+        image, image_rgb = item
         frame += 1
         
-        image.flags.writeable = False
-        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        results = pose.process(image)
+        results = pose.process(image_rgb)
         
-        # calculate angle of knee
+        # collect joint coordinates for angle calculation
         if results.pose_landmarks:
             landmarks = results.pose_landmarks.landmark
             
-            # right side landmarks
-            hip = landmarks[24] # right hip
-            knee = landmarks[26] # right knee
-            ankle = landmarks[28] # right ankle
-            shoulder = landmarks[12] # right shoulder
-            toe = landmarks[32] # right toe
-            
-            # calculate angles of interest
-            knee_angle = calculate_angle(hip, knee, ankle)
-            hip_angle = calculate_angle(shoulder, hip, knee)
-            ankle_angle = calculate_angle(knee, ankle, toe)
-
-            # create vertical reference point for back angle
-            # This point is directly below the hip in the image (y increases downward)
-            vertical_point = Point(hip.x, hip.y + 0.2, hip.z)
-            back_angle = calculate_angle(shoulder, hip, vertical_point)
-
-            # store all angles
-            knee_angles.append(knee_angle)
-            hip_angles.append(hip_angle)
-            ankle_angles.append(ankle_angle)
-            back_angles.append(back_angle)
+            # frame count from the container can be an underestimate
+            if frame > len(joint_coords):
+                new_len = max(2 * len(joint_coords), frame)
+                joint_coords = np.concatenate(
+                    [joint_coords, np.full((new_len - len(joint_coords), 5, 3), np.nan, dtype=np.float32)])
+
+            # gather right side landmarks in a single indexing op
+            landmark_arr = np.array(
+                [(lm.x, lm.y, lm.z) for lm in landmarks], dtype=np.float32)
+            joint_coords[frame - 1] = landmark_arr[JOINT_IDXS]
         
-        # draw pose annotations on image
-        image.flags.writeable = True
-        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+        if HEADLESS:
+            continue
+
+        # draw pose annotations directly on the original BGR frame
         mp_drawing.draw_landmarks(
             image,
             results.pose_landmarks,
@@ -82,41 +117,46 @@ with mp_pose.Pose(
         cv2.imshow('MediaPipe Pose', image)
         if cv2.waitKey(5) & 0xFF == 27:
             break
+
+# stop the decoder, draining the queue so a blocked put() can finish
+stop_decoding.set()
+while decoder.is_alive():
+    while not frame_queue.empty():
+        frame_queue.get_nowait()
+    decoder.join(timeout=0.1)
 cap.release()
 cv2.destroyAllWindows
 
-# plot all angles over time
-plt.figure(figsize=(14, 10))
-
-# subplot for each angle
-plt.subplot(2, 2, 1)
-plt.plot(knee_angles, linewidth=2, color='blue')
-plt.xlabel('Frame Number')
-plt.ylabel('Angle (degrees)')
-plt.title('Knee Angle Over Time')
-plt.grid(True, alpha=0.3)
-plt.axhline(y=90, color='r', linestyle='--', label='90° reference')
-
-plt.subplot(2, 2, 2)
-plt.plot(hip_angles, linewidth=2, color='green')
-plt.xlabel('Frame Number')
-plt.ylabel('Angle (degrees)')
-plt.title('Hip Angle Over Time')
-plt.grid(True, alpha=0.3)
-
-plt.subplot(2, 2, 3)
-plt.plot(back_angles, linewidth=2, color='orange')
-plt.xlabel('Frame Number')
-plt.ylabel('Angle (degrees)')
-plt.title('Back/Torso Angle Over Time')
-plt.grid(True, alpha=0.3)
-
-plt.subplot(2, 2, 4)
-plt.plot(ankle_angles, linewidth=2, color='purple')
-plt.xlabel('Frame Number')
-plt.ylabel('Angle (degrees)')
-plt.title('Ankle Angle Over Time')
-plt.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+# calculate all angles of interest in one vectorized pass
+coords = joint_coords[:frame]
+hip, knee, ankle, shoulder, toe = (coords[:, i] for i in range(5))
+
+knee_angles = calculate_angles_batch(hip, knee, ankle)
+hip_angles = calculate_angles_batch(shoulder, hip, knee)
+ankle_angles = calculate_angles_batch(knee, ankle, toe)
+# back angle is measured against the vertical below the hip (y increases downward)
+back_angles = calculate_vertical_angles_batch(shoulder, hip)
+
+# plot all angles over time, one subplot per angle
+fig, axes = plt.subplots(2, 2, figsize=(14, 10), sharex=True)
+
+plots = [
+    (axes[0, 0], knee_angles, 'blue', 'Knee Angle Over Time'),
+    (axes[0, 1], hip_angles, 'green', 'Hip Angle Over Time'),
+    (axes[1, 0], back_angles, 'orange', 'Back/Torso Angle Over Time'),
+    (axes[1, 1], ankle_angles, 'purple', 'Ankle Angle Over Time'),
+]
+for ax, angles, color, title in plots:
+    ax.plot(angles, linewidth=2, color=color)
+    ax.set_xlabel('Frame Number')
+    ax.set_ylabel('Angle (degrees)')
+    ax.set_title(title)
+    ax.grid(True, alpha=0.3)
+axes[0, 0].axhline(y=90, color='r', linestyle='--', label='90° reference')
+
+fig.tight_layout()
+if HEADLESS:
+    fig.savefig('angles.png', dpi=100)
+    print("Saved angle plot to angles.png")
+else:
+    plt.show()
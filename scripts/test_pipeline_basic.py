@@ -11,7 +11,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.pose.pipeline import process_video
 
 def test_basic_pipeline():
-    """Test basic pipeline without visualization."""
+    """Test basic pipeline without visualization.
+
+    Runs with visualize=False, so only detection and angle extraction
+    are exercised (no frame copies or skeleton drawing).
+    """
 
     # TODO: Replace with your actual video path
     video_path = "data/videos/good_form/squat.mp4"
@@ -5,6 +5,19 @@ Provides verbose output to help troubleshoot issues.
 import sys
 from pathlib import Path
 import json
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _to_json(obj) -> bytes:
+    """Serialize to indented UTF-8 JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2).encode()
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -12,7 +25,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.pose.pipeline import process_video
 
 def test_pipeline_debug():
-    """Test pipeline with detailed debug output."""
+    """Test pipeline with detailed debug output.
+
+    Runs with visualize=False, so only detection and angle extraction
+    are exercised (no frame copies or skeleton drawing).
+    """
 
     # TODO: Update video path
     video_path = "data/videos/good_form/squat.mp4"
@@ -33,7 +50,7 @@ def test_pipeline_debug():
 
     print("\n📊 METADATA:")
     print("-" * 60)
-    print(json.dumps(result['metadata'], indent=2))
+    print(_to_json(result['metadata']).decode())
 
     print("\n📈 STATISTICS:")
     print("-" * 60)
@@ -46,22 +63,28 @@ def test_pipeline_debug():
     print("\n📐 ANGLE ANALYSIS:")
     print("-" * 60)
 
-    left_angles = [a['knee_left'] for a in result['angles'] if a['knee_left'] is not None]
-    right_angles = [a['knee_right'] for a in result['angles'] if a['knee_right'] is not None]
+    left_angles = np.fromiter(
+        (a['knee_left'] for a in result['angles'] if a['knee_left'] is not None),
+        dtype=np.float32
+    )
+    right_angles = np.fromiter(
+        (a['knee_right'] for a in result['angles'] if a['knee_right'] is not None),
+        dtype=np.float32
+    )
 
-    if left_angles:
-        print(f"Left knee angles detected: {len(left_angles)}")
-        print(f"  Min:  {min(left_angles):.1f}°")
-        print(f"  Max:  {max(left_angles):.1f}°")
-        print(f"  Avg:  {sum(left_angles)/len(left_angles):.1f}°")
+    if left_angles.size:
+        print(f"Left knee angles detected: {left_angles.size}")
+        print(f"  Min:  {left_angles.min():.1f}°")
+        print(f"  Max:  {left_angles.max():.1f}°")
+        print(f"  Avg:  {left_angles.mean():.1f}°")
     else:
         print("⚠️  No left knee angles detected!")
 
-    if right_angles:
-        print(f"\nRight knee angles detected: {len(right_angles)}")
-        print(f"  Min:  {min(right_angles):.1f}°")
-        print(f"  Max:  {max(right_angles):.1f}°")
-        print(f"  Avg:  {sum(right_angles)/len(right_angles):.1f}°")
+    if right_angles.size:
+        print(f"\nRight knee angles detected: {right_angles.size}")
+        print(f"  Min:  {right_angles.min():.1f}°")
+        print(f"  Max:  {right_angles.max():.1f}°")
+        print(f"  Avg:  {right_angles.mean():.1f}°")
     else:
         print("⚠️  No right knee angles detected!")
 
@@ -96,7 +119,7 @@ def test_pipeline_debug():
         print("   - Better lighting conditions")
         issues_found = True
 
-    if left_angles and (min(left_angles) < 10 or max(left_angles) > 175):
+    if left_angles.size and (left_angles.min() < 10 or left_angles.max() > 175):
         print("⚠️  WARNING: Extreme angle values detected")
         print("   This might indicate:")
         print("   - Incorrect landmark detection")
@@ -116,8 +139,8 @@ def test_pipeline_debug():
     print(f"\n💾 Saving detailed results to: {output_file}")
     Path(output_file).parent.mkdir(exist_ok=True)
 
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(_to_json(result))
 
     print(f"✅ Results saved!")
 
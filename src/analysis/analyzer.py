@@ -2,10 +2,11 @@
 Main entry point for video form analysis
 """
 
+from operator import itemgetter
 from typing import Dict, Any, Optional
 from src.pose.pipeline import process_video
 from src.analysis.form_rules import evaluate_form
-from src.analysis.scoring import calculate_score, is_passing
+from src.analysis.scoring import calculate_score
 from src.analysis.feedback import generate_feedback, generate_summary
 from src.analysis.models import FormResult
 
@@ -29,13 +30,11 @@ def transform_angles(angles_data: list) -> Dict[str, list]:
     # Get all angle names (exclude 'frame' key)
     angle_names = [key for key in angles_data[0].keys() if key != 'frame']
 
-    # Build dict of lists
-    transformed = {}
-    for angle_name in angle_names:
-        transformed[angle_name] = [
-            frame_data.get(angle_name)
-            for frame_data in angles_data
-        ]
+    # Build dict of lists, extracting each column with a C-level itemgetter
+    transformed = {
+        angle_name: list(map(itemgetter(angle_name), angles_data))
+        for angle_name in angle_names
+    }
 
     return transformed
 
@@ -89,7 +88,6 @@ def analyze_video(
     form_result = FormResult(
         score=score,
         violations=violations,
-        passed=is_passing(score),
         feedback_summary=feedback_items,
         details={
             'summary': summary,
@@ -2,25 +2,30 @@
 Feedback generation for squat form analysis
 """
 
+import heapq
+from itertools import islice
+from operator import attrgetter
 from typing import List
 from .models import FormViolation, Severity
 
 # Maximum feedback items to show
 MAX_FEEDBACK_ITEMS = 5
 
-# Severity ordering for prioritization
-SEVERITY_ORDER = {
-    Severity.CRITICAL: 0,
-    Severity.HIGH: 1,
-    Severity.MEDIUM: 2,
-    Severity.LOW: 3
+# Feedback category for each severity level
+_SEVERITY_BUCKET = {
+    Severity.CRITICAL: 'critical_issues',
+    Severity.HIGH: 'improvements',
+    Severity.MEDIUM: 'improvements',
+    Severity.LOW: 'optimizations'
 }
 
+_get_feedback = attrgetter('feedback')
+
 
 def generate_feedback(violations: List[FormViolation], max_items: int = MAX_FEEDBACK_ITEMS) -> List[str]:
     """Generate prioritized feedback from violations
 
-    Filters to failed violations, sorts by severity, and returns top N messages
+    Filters to failed violations, selects the N most severe, and returns their messages
 
     Args:
         violations (List[FormViolation]): All form violations
@@ -36,12 +41,12 @@ def generate_feedback(violations: List[FormViolation], max_items: int = MAX_FEED
     if not failed:
         return []
 
-    # Sort by severity (critical first)
-    sorted_violations = sorted(failed, key=lambda v: SEVERITY_ORDER[v.severity])
+    # Take top N by severity (critical first, Severity values are the priority order)
+    # nsmallest keeps input order within a severity, same as sorted()[:max_items]
+    top_violations = heapq.nsmallest(max_items, failed, key=attrgetter('severity'))
 
-    # Take top N and extract feedback
-    top_violations = sorted_violations[:max_items]
-    feedback = [v.feedback for v in top_violations]
+    # Extract feedback
+    feedback = list(map(_get_feedback, top_violations))
 
     return feedback
 
@@ -57,10 +62,8 @@ def generate_summary(violations: List[FormViolation], score: int) -> str:
         str: Summary message based on score and critical violations
     """
 
-    # Check for critical safety issues
-    critical_violations = [v for v in violations if v.severity == Severity.CRITICAL and not v.passed]
-
-    if critical_violations:
+    # Check for critical safety issues (stops at the first one)
+    if any(v.severity is Severity.CRITICAL and not v.passed for v in violations):
         return 'Critical safety issues detected - address immediately'
 
     # Score-based summary
@@ -84,13 +87,9 @@ def generate_positive_feedback(violations: List[FormViolation]) -> List[str]:
         List[str]: Positive feedback messages (limited to 3)
     """
 
-    passed = [v for v in violations if v.passed]
-
-    if not passed:
-        return []
-
-    # Take up to 3 positive items
-    positive_messages = [v.feedback for v in passed[:3]]
+    # Take up to 3 positive items, stopping once they are found
+    passed = (v for v in violations if v.passed)
+    positive_messages = list(map(_get_feedback, islice(passed, 3)))
 
     return positive_messages
 
@@ -105,7 +104,23 @@ def format_feedback_numbered(feedback: List[str]) -> List[str]:
         List[str]: Numbered feedback
     """
 
-    return [f'{i+1}. {item}' for i, item in enumerate(feedback)]
+    return [f'{i}. {item}' for i, item in enumerate(feedback, 1)]
+
+
+def format_feedback_numbered_str(feedback: List[str]) -> str:
+    """Format feedback as a single numbered, newline-separated string
+
+    Use instead of format_feedback_numbered() when the lines are only
+    going to be joined for display.
+
+    Args:
+        feedback (List[str]): List of feedback strings
+
+    Returns:
+        str: Numbered feedback, one item per line
+    """
+
+    return '\n'.join(f'{i}. {item}' for i, item in enumerate(feedback, 1))
 
 
 def categorize_feedback(violations: List[FormViolation]) -> dict:
@@ -128,11 +143,6 @@ def categorize_feedback(violations: List[FormViolation]) -> dict:
         if violation.passed:
             continue
 
-        if violation.severity == Severity.CRITICAL:
-            categorized['critical_issues'].append(violation.feedback)
-        elif violation.severity in [Severity.HIGH, Severity.MEDIUM]:
-            categorized['improvements'].append(violation.feedback)
-        else:
-            categorized['optimizations'].append(violation.feedback)
+        categorized[_SEVERITY_BUCKET[violation.severity]].append(violation.feedback)
 
     return categorized
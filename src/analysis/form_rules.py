@@ -6,8 +6,12 @@ Straub RK, Powers CM. "A Biomechanical Review of the Squat Exercise."
 IJSPT 2024;19(4):490-501.
 """
 
-from typing import Dict, List, Tuple
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Union
+from src.utils.numba_compat import NUMBA_AVAILABLE
 from .models import FormViolation, Severity
+from .form_rules_numba import _spine_scan as _spine_scan_jit
 
 # Spine neutral thresholds
 SPINE_NEUTRAL_CONFIG = {
@@ -35,6 +39,45 @@ HIP_ANGLE_CONFIG = {
     'danger_threshold': 40,
 }
 
+# Depth zones by minimum knee angle, looked up with np.searchsorted(side='right').
+# Upper limits of the ideal and shallow zones are inclusive, hence nextafter.
+_DEPTH_BOUNDS = np.array([
+    SQUAT_DEPTH_CONFIG['danger_threshold'],
+    SQUAT_DEPTH_CONFIG['ideal_min'],
+    np.nextafter(SQUAT_DEPTH_CONFIG['ideal_max'], np.inf),
+    np.nextafter(SQUAT_DEPTH_CONFIG['acceptable_max'], np.inf),
+], dtype=np.float64)
+# (rule_name, severity, passed, score_penalty, feedback template)
+_DEPTH_ZONES = (
+    ('depth_excessive', Severity.HIGH, False, 15,
+     'Squat too deep ({:.0f}°) - risk of form breakdown and joint stress'),
+    ('depth_deep', Severity.LOW, True, 0,
+     'Deep squat ({:.0f}°) - ensure spine stays neutral'),
+    ('depth_ideal', Severity.LOW, True, 0,
+     'Perfect depth - thigh parallel to floor ({:.0f}°)'),
+    ('depth_shallow', Severity.MEDIUM, False, 10,
+     'Squat slightly shallow ({:.0f}°) - try to reach thigh parallel if comfortable'),
+    ('depth_very_shallow', Severity.HIGH, False, 20,
+     'Squat very shallow ({:.0f}°) - increase depth to get benefits'),
+)
+
+# Hip zones by minimum hip angle, looked up with np.searchsorted(side='right').
+# Between watch_threshold and ideal_min nothing is reported.
+_HIP_BOUNDS = np.array([
+    HIP_ANGLE_CONFIG['danger_threshold'],
+    HIP_ANGLE_CONFIG['watch_threshold'],
+    HIP_ANGLE_CONFIG['ideal_min'],
+], dtype=np.float64)
+_HIP_ZONES = (
+    ('hip_angle_excessive', Severity.HIGH, False, 15,
+     'Excessive hip flexion ({:.0f}°) - likely causing spine rounding'),
+    ('hip_angle_deep', Severity.MEDIUM, False, 5,
+     'Deep hip flexion ({:.0f}°) - watch for posterior pelvic tilt'),
+    None,
+    ('hip_angle_good', Severity.LOW, True, 0,
+     'Good hip depth ({:.0f}°)'),
+)
+
 # Trunk inclination thresholds (from vertical)
 TRUNK_INCLINATION_CONFIG = {
     'good_max': 45,
@@ -50,75 +93,231 @@ TIBIA_INCLINATION_CONFIG = {
 }
 
 
-def _average_bilateral(left: List, right: List) -> List:
-    """Average bilateral angles, handling None values
+def _to_nan_array(values) -> np.ndarray:
+    """Convert angle measurements to a float64 array with NaN for missing
+
+    Args:
+        values: Angle measurements as a list (may contain None) or ndarray
+
+    Returns:
+        np.ndarray: float64 array, None values replaced by NaN
+    """
+
+    return np.asarray(values if values is not None else [], dtype=np.float64)
+
+
+def _average_bilateral(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Average bilateral angles, handling missing values
+
+    Args:
+        left (np.ndarray): Left side angle measurements (NaN = missing)
+        right (np.ndarray): Right side angle measurements (NaN = missing)
+
+    Returns:
+        np.ndarray: Averaged angles, falling back to whichever side is present
+    """
+
+    n = min(len(left), len(right))
+    both = np.vstack([left[:n], right[:n]])
+
+    # NaN-aware mean; frames missing on both sides divide 0 by 0 -> NaN
+    with np.errstate(invalid='ignore'):
+        return np.nansum(both, axis=0) / np.count_nonzero(~np.isnan(both), axis=0)
+
+
+def _bilateral_angles(left, right) -> np.ndarray:
+    """Average the two sides of an already filtered bilateral angle
+
+    Args:
+        left: Left side angle measurements (may be empty or None)
+        right: Right side angle measurements (may be empty or None)
+
+    Returns:
+        np.ndarray: Averaged angles. Uses the available side if only one
+        side was measured; empty if neither was.
+    """
+
+    left = _to_nan_array(left)
+    right = _to_nan_array(right)
+
+    if left.size and right.size:
+        return _average_bilateral(left, right)
+    return left if left.size else right
+
+
+def _zone_violation(bounds: np.ndarray, zones: Tuple, value: float, detail_key: str) -> List[FormViolation]:
+    """Classify a value into a threshold zone and build its violation
 
     Args:
-        left (List): Left side angle measurements (may contain None)
-        right (List): Right side angle measurements (may contain None)
+        bounds (np.ndarray): Sorted zone boundaries
+        zones (Tuple): One (rule_name, severity, passed, score_penalty, template)
+            entry per zone, or None for zones that report nothing
+        value (float): Measured angle
+        detail_key (str): Key for the angle in the violation details
 
     Returns:
-        List: Averaged angles with None handling
+        List[FormViolation]: The zone's violation, or empty list
     """
 
-    result = []
-    for l, r in zip(left, right):
-        if l is not None and r is not None:
-            result.append((l + r) / 2)
-        elif l is not None:
-            result.append(l)
-        elif r is not None:
-            result.append(r)
-        else:
-            result.append(None)
-    return result
+    zone = zones[int(np.searchsorted(bounds, value, side='right'))]
+    if zone is None:
+        return []
+
+    rule_name, severity, passed, score_penalty, template = zone
+    return [FormViolation(
+        rule_name=rule_name,
+        severity=severity,
+        passed=passed,
+        score_penalty=score_penalty,
+        feedback=template.format(value),
+        details={detail_key: value}
+    )]
 
 
-def _filter_outliers(values: List, percentile_range: float = 0.1) -> List:
+def _filter_outliers(values: np.ndarray, percentile_range: float = 0.1) -> np.ndarray:
     """Remove statistical outliers from angle measurements
 
     Uses percentile-based filtering to remove extreme values.
     Handles MediaPipe detection glitches that create extreme angle spikes.
 
     Args:
-        values (List): List of angle values (may contain None)
+        values (np.ndarray): Angle values (NaN = missing)
         percentile_range (float): Fraction to trim from each tail (default 0.1)
 
     Returns:
-        List: List with outliers removed, preserving None values
+        np.ndarray: Copy with outliers replaced by NaN, preserving missing values
     """
 
-    valid = [x for x in values if x is not None]
+    values = _to_nan_array(values)
+    valid = values[~np.isnan(values)]
 
     if len(valid) < 10:
         return values
 
-    # Sort and calculate percentile bounds
-    sorted_valid = sorted(valid)
-    n = len(sorted_valid)
+    # Calculate percentile bounds (order statistics of the valid values)
+    n = len(valid)
     lower_idx = int(n * percentile_range)
     upper_idx = int(n * (1 - percentile_range))
 
     if lower_idx >= upper_idx:
         return values
 
-    lower_bound = sorted_valid[lower_idx]
-    upper_bound = sorted_valid[upper_idx - 1]
+    partitioned = np.partition(valid, [lower_idx, upper_idx - 1])
+    lower_bound = partitioned[lower_idx]
+    upper_bound = partitioned[upper_idx - 1]
 
     # Filter values outside bounds
-    filtered = []
-    for val in values:
-        if val is None:
-            filtered.append(None)
-        elif lower_bound <= val <= upper_bound:
-            filtered.append(val)
-        else:
-            filtered.append(None)
+    filtered = values.copy()
+    filtered[(values < lower_bound) | (values > upper_bound)] = np.nan
 
     return filtered
 
 
-def check_spine_neutral(angles: Dict[str, List[float]]) -> List[FormViolation]:
+def _filter_angles(angles: Dict[str, List[float]]) -> Dict[str, np.ndarray]:
+    """Filter outliers from every angle series once
+
+    Args:
+        angles (Dict[str, List[float]]): Dict of raw angle series
+
+    Returns:
+        Dict[str, np.ndarray]: Same keys, outliers replaced by NaN
+    """
+
+    return {name: _filter_outliers(values) for name, values in angles.items()}
+
+
+def _nanmin(values: np.ndarray) -> float:
+    """Minimum of the non-missing values, NaN if there are none"""
+
+    valid = values[~np.isnan(values)]
+    return float(valid.min()) if valid.size else np.nan
+
+
+@dataclass(slots=True)
+class AnglePrep:
+    """Angle series preprocessed once and shared by all rule checks
+
+    Attributes:
+        back (np.ndarray): Outlier-filtered bilateral back angles (NaN = missing)
+        hip (np.ndarray): Outlier-filtered bilateral hip angles (NaN = missing)
+        knee_min (float): Minimum knee angle over both sides (NaN if none)
+        hip_min (float): Minimum of the bilateral hip angles (NaN if none)
+    """
+
+    back: np.ndarray
+    hip: np.ndarray
+    knee_min: float
+    hip_min: float
+
+
+def prepare_angles(angles: Dict[str, List[float]]) -> AnglePrep:
+    """Filter outliers and reduce the raw angle series for the rule checks
+
+    Args:
+        angles (Dict[str, List[float]]): Dict with knee_left, hip_left, back_left, etc.
+
+    Returns:
+        AnglePrep: Shared arrays and reductions used by the checks
+    """
+
+    filtered = _filter_angles(angles)
+
+    back = _bilateral_angles(filtered.get('back_left'), filtered.get('back_right'))
+    hip = _bilateral_angles(filtered.get('hip_left'), filtered.get('hip_right'))
+
+    # Use minimum of both knees (worse side = more conservative)
+    knee = np.concatenate([
+        _to_nan_array(filtered.get('knee_left')),
+        _to_nan_array(filtered.get('knee_right')),
+    ])
+
+    return AnglePrep(back=back, hip=hip, knee_min=_nanmin(knee), hip_min=_nanmin(hip))
+
+
+def _spine_scan_numpy(back_angles: np.ndarray, max_sudden_change: float, min_consecutive: int) -> Tuple:
+    """Vectorized NumPy version of form_rules_numba._spine_scan
+
+    Args:
+        back_angles (np.ndarray): float64 back angles (NaN = missing)
+        max_sudden_change (float): Frame-to-frame change threshold in degrees
+        min_consecutive (int): Minimum run length to report
+
+    Returns:
+        Tuple: (run_starts, run_lengths, run_max_changes, back_min, back_max)
+    """
+
+    # NaN (missing) changes compare False and never count as violations
+    changes = np.abs(np.diff(back_angles))
+    with np.errstate(invalid='ignore'):
+        flags = changes > max_sudden_change
+
+    # Group into consecutive sequences: run edges of the violation flags
+    edges = np.diff(np.concatenate(([0], flags.view(np.int8), [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_lengths = np.flatnonzero(edges == -1) - run_starts
+
+    keep = run_lengths >= min_consecutive
+    run_starts = run_starts[keep]
+    run_lengths = run_lengths[keep]
+    run_max_changes = np.array([
+        changes[start:start + length].max()
+        for start, length in zip(run_starts, run_lengths)
+    ], dtype=np.float64)
+
+    valid_back = back_angles[~np.isnan(back_angles)]
+    if valid_back.size:
+        back_min, back_max = valid_back.min(), valid_back.max()
+    else:
+        back_min = back_max = np.nan
+
+    return run_starts, run_lengths, run_max_changes, back_min, back_max
+
+
+# Single-pass JIT kernel when Numba is installed, NumPy otherwise
+_spine_scan = _spine_scan_jit if NUMBA_AVAILABLE else _spine_scan_numpy
+
+
+def check_spine_neutral(angles: Union[Dict[str, List[float]], AnglePrep]) -> List[FormViolation]:
     """Check if spine remains neutral throughout squat
 
     Uses proxy measures since we can't directly measure spine curvature:
@@ -127,7 +326,8 @@ def check_spine_neutral(angles: Dict[str, List[float]]) -> List[FormViolation]:
     - Excessive total range of back angle motion
 
     Args:
-        angles (Dict[str, List[float]]): Dict with back_left, hip_left, etc.
+        angles (Union[Dict[str, List[float]], AnglePrep]): Dict with back_left,
+            hip_left, etc., or angles already run through prepare_angles
 
     Returns:
         List[FormViolation]: List of violations found (empty if passed)
@@ -135,107 +335,57 @@ def check_spine_neutral(angles: Dict[str, List[float]]) -> List[FormViolation]:
 
     violations = []
 
-    back_left = angles.get('back_left')
-    back_right = angles.get('back_right')
-
-    # Average the two sides for more robust measurement
-    if back_left and back_right:
-        back_left_filtered = _filter_outliers(back_left)
-        back_right_filtered = _filter_outliers(back_right)
-        back_angles = _average_bilateral(back_left_filtered, back_right_filtered)
-    elif back_left:
-        back_angles = _filter_outliers(back_left)
-    elif back_right:
-        back_angles = _filter_outliers(back_right)
-    else:
+    prep = angles if isinstance(angles, AnglePrep) else prepare_angles(angles)
+
+    back_angles = prep.back
+    if not back_angles.size:
         return violations
 
-    # Check 1: Sudden changes (consecutive frame requirement)
-    violation_frames = []
-    for i in range(len(back_angles) - 1):
-        if back_angles[i] is not None and back_angles[i+1] is not None:
-            change = abs(back_angles[i+1] - back_angles[i])
-            if change > SPINE_NEUTRAL_CONFIG['max_sudden_change']:
-                violation_frames.append(i)
-
-    # Group into consecutive sequences
-    if violation_frames:
-        sequences = []
-        current_seq = [violation_frames[0]]
-
-        for frame in violation_frames[1:]:
-            if frame == current_seq[-1] + 1:
-                current_seq.append(frame)
-            else:
-                sequences.append(current_seq)
-                current_seq = [frame]
-        sequences.append(current_seq)
-
-        # Only report sequences meeting minimum consecutive frame requirement
-        min_consecutive = SPINE_NEUTRAL_CONFIG['min_consecutive_frames']
-        for seq in sequences:
-            if len(seq) >= min_consecutive:
-                # Calculate max change in this sequence
-                max_change = max(
-                    abs(back_angles[i+1] - back_angles[i])
-                    for i in seq
-                    if back_angles[i] is not None and back_angles[i+1] is not None
-                )
-                violations.append(FormViolation(
-                    rule_name='spine_sudden_change',
-                    severity=Severity.CRITICAL,
-                    passed=False,
-                    score_penalty=30,
-                    feedback=f'Sustained spine movement detected ({len(seq)} consecutive frames) - maintain neutral spine',
-                    frames=seq + [seq[-1] + 1],
-                    details={'max_change': max_change, 'threshold': SPINE_NEUTRAL_CONFIG['max_sudden_change'], 'num_frames': len(seq)}
-                ))
+    run_starts, run_lengths, run_max_changes, back_min, back_max = _spine_scan(
+        back_angles,
+        SPINE_NEUTRAL_CONFIG['max_sudden_change'],
+        SPINE_NEUTRAL_CONFIG['min_consecutive_frames']
+    )
+    has_valid_back = not np.isnan(back_min)
+
+    # Check 1: Sudden changes (sequences meeting minimum consecutive frame requirement)
+    for start, num_frames, max_change in zip(run_starts.tolist(), run_lengths.tolist(), run_max_changes.tolist()):
+        violations.append(FormViolation(
+            rule_name='spine_sudden_change',
+            severity=Severity.CRITICAL,
+            passed=False,
+            score_penalty=30,
+            feedback=f'Sustained spine movement detected ({num_frames} consecutive frames) - maintain neutral spine',
+            frames=list(range(start, start + num_frames + 1)),
+            details={'max_change': max_change, 'threshold': SPINE_NEUTRAL_CONFIG['max_sudden_change'], 'num_frames': num_frames}
+        ))
 
     # Check 2: Butt wink pattern (aggregate analysis)
-    hip_left = angles.get('hip_left', [])
-    hip_right = angles.get('hip_right', [])
-
-    # Average both sides for hip angle
-    if hip_left and hip_right:
-        hip_left_filtered = _filter_outliers(hip_left)
-        hip_right_filtered = _filter_outliers(hip_right)
-        hip_angles = _average_bilateral(hip_left_filtered, hip_right_filtered)
-    elif hip_left:
-        hip_angles = _filter_outliers(hip_left)
-    elif hip_right:
-        hip_angles = _filter_outliers(hip_right)
-    else:
-        hip_angles = []
-
-    if hip_angles:
-        valid_hip = [x for x in hip_angles if x is not None]
-        valid_back = [x for x in back_angles if x is not None]
-
-        if valid_hip and valid_back:
-            min_hip = min(valid_hip)
-            back_range = max(valid_back) - min(valid_back)
-
-            # Butt wink = deep hip flexion + large back angle change
-            if (min_hip < SPINE_NEUTRAL_CONFIG['butt_wink_hip_threshold'] and
-                back_range > SPINE_NEUTRAL_CONFIG['butt_wink_back_change']):
-                violations.append(FormViolation(
-                    rule_name='butt_wink',
-                    severity=Severity.CRITICAL,
-                    passed=False,
-                    score_penalty=25,
-                    feedback=f'Butt wink detected - squatting beyond hip mobility (hip: {min_hip:.0f}°, back change: {back_range:.0f}°)',
-                    details={
-                        'min_hip_angle': min_hip,
-                        'back_range': back_range,
-                        'hip_threshold': SPINE_NEUTRAL_CONFIG['butt_wink_hip_threshold'],
-                        'back_threshold': SPINE_NEUTRAL_CONFIG['butt_wink_back_change']
-                    }
-                ))
+    min_hip = prep.hip_min
+
+    if not np.isnan(min_hip) and has_valid_back:
+        back_range = float(back_max - back_min)
+
+        # Butt wink = deep hip flexion + large back angle change
+        if (min_hip < SPINE_NEUTRAL_CONFIG['butt_wink_hip_threshold'] and
+            back_range > SPINE_NEUTRAL_CONFIG['butt_wink_back_change']):
+            violations.append(FormViolation(
+                rule_name='butt_wink',
+                severity=Severity.CRITICAL,
+                passed=False,
+                score_penalty=25,
+                feedback=f'Butt wink detected - squatting beyond hip mobility (hip: {min_hip:.0f}°, back change: {back_range:.0f}°)',
+                details={
+                    'min_hip_angle': min_hip,
+                    'back_range': back_range,
+                    'hip_threshold': SPINE_NEUTRAL_CONFIG['butt_wink_hip_threshold'],
+                    'back_threshold': SPINE_NEUTRAL_CONFIG['butt_wink_back_change']
+                }
+            ))
 
     # Check 3: Excessive total range
-    valid_back = [x for x in back_angles if x is not None]
-    if valid_back:
-        back_range = max(valid_back) - min(valid_back)
+    if has_valid_back:
+        back_range = float(back_max - back_min)
         if back_range > SPINE_NEUTRAL_CONFIG['max_total_range']:
             violations.append(FormViolation(
                 rule_name='excessive_spine_movement',
@@ -252,7 +402,7 @@ def check_spine_neutral(angles: Dict[str, List[float]]) -> List[FormViolation]:
     return violations
 
 
-def check_squat_depth(angles: Dict[str, List[float]]) -> List[FormViolation]:
+def check_squat_depth(angles: Union[Dict[str, List[float]], AnglePrep]) -> List[FormViolation]:
     """Check if squat depth is appropriate and safe
 
     Evaluates minimum knee angle achieved during squat:
@@ -261,7 +411,8 @@ def check_squat_depth(angles: Dict[str, List[float]]) -> List[FormViolation]:
     - Too deep: <40° (joint stress risk)
 
     Args:
-        angles (Dict[str, List[float]]): Dict with knee_left, knee_right
+        angles (Union[Dict[str, List[float]], AnglePrep]): Dict with knee_left,
+            knee_right, or angles already run through prepare_angles
 
     Returns:
         List[FormViolation]: List of violations found
@@ -269,98 +420,27 @@ def check_squat_depth(angles: Dict[str, List[float]]) -> List[FormViolation]:
 
     violations = []
 
-    knee_left = angles.get('knee_left', [])
-    knee_right = angles.get('knee_right', [])
-
-    # Filter outliers from knee angles
-    knee_left_filtered = _filter_outliers(knee_left) if knee_left else []
-    knee_right_filtered = _filter_outliers(knee_right) if knee_right else []
-
-    # Use minimum of both sides (worse side = more conservative)
-    if knee_left_filtered and knee_right_filtered:
-        valid_left = [x for x in knee_left_filtered if x is not None]
-        valid_right = [x for x in knee_right_filtered if x is not None]
-        if valid_left and valid_right:
-            min_knee = min(min(valid_left), min(valid_right))
-        elif valid_left:
-            min_knee = min(valid_left)
-        elif valid_right:
-            min_knee = min(valid_right)
-        else:
-            return violations
-    elif knee_left_filtered:
-        valid_left = [x for x in knee_left_filtered if x is not None]
-        if valid_left:
-            min_knee = min(valid_left)
-        else:
-            return violations
-    elif knee_right_filtered:
-        valid_right = [x for x in knee_right_filtered if x is not None]
-        if valid_right:
-            min_knee = min(valid_right)
-        else:
-            return violations
-    else:
+    prep = angles if isinstance(angles, AnglePrep) else prepare_angles(angles)
+
+    min_knee = prep.knee_min
+    if np.isnan(min_knee):
         return violations
 
     # Evaluate depth zones
-    if SQUAT_DEPTH_CONFIG['ideal_min'] <= min_knee <= SQUAT_DEPTH_CONFIG['ideal_max']:
-        violations.append(FormViolation(
-            rule_name='depth_ideal',
-            severity=Severity.LOW,
-            passed=True,
-            score_penalty=0,
-            feedback=f'Perfect depth - thigh parallel to floor ({min_knee:.0f}°)',
-            details={'min_knee': min_knee}
-        ))
-    elif SQUAT_DEPTH_CONFIG['acceptable_min'] <= min_knee < SQUAT_DEPTH_CONFIG['ideal_min']:
-        violations.append(FormViolation(
-            rule_name='depth_deep',
-            severity=Severity.LOW,
-            passed=True,
-            score_penalty=0,
-            feedback=f'Deep squat ({min_knee:.0f}°) - ensure spine stays neutral',
-            details={'min_knee': min_knee}
-        ))
-    elif SQUAT_DEPTH_CONFIG['ideal_max'] < min_knee <= SQUAT_DEPTH_CONFIG['acceptable_max']:
-        violations.append(FormViolation(
-            rule_name='depth_shallow',
-            severity=Severity.MEDIUM,
-            passed=False,
-            score_penalty=10,
-            feedback=f'Squat slightly shallow ({min_knee:.0f}°) - try to reach thigh parallel if comfortable',
-            details={'min_knee': min_knee}
-        ))
-    elif min_knee < SQUAT_DEPTH_CONFIG['danger_threshold']:
-        violations.append(FormViolation(
-            rule_name='depth_excessive',
-            severity=Severity.HIGH,
-            passed=False,
-            score_penalty=15,
-            feedback=f'Squat too deep ({min_knee:.0f}°) - risk of form breakdown and joint stress',
-            details={'min_knee': min_knee}
-        ))
-    else:
-        violations.append(FormViolation(
-            rule_name='depth_very_shallow',
-            severity=Severity.HIGH,
-            passed=False,
-            score_penalty=20,
-            feedback=f'Squat very shallow ({min_knee:.0f}°) - increase depth to get benefits',
-            details={'min_knee': min_knee}
-        ))
+    violations.extend(_zone_violation(_DEPTH_BOUNDS, _DEPTH_ZONES, min_knee, 'min_knee'))
 
     return violations
 
 
-def check_hip_angle(angles: Dict[str, List[float]]) -> List[FormViolation]:
+def check_hip_angle(angles: Union[Dict[str, List[float]], AnglePrep]) -> List[FormViolation]:
     """Check if hip flexion is within safe range
 
     Hip angle below ~60° may trigger posterior pelvic tilt (butt wink).
     Should be checked in combination with spine angle.
 
     Args:
-        angles (Dict[str, List[float]]): Dict with hip_left, hip_right
+        angles (Union[Dict[str, List[float]], AnglePrep]): Dict with hip_left,
+            hip_right, or angles already run through prepare_angles
 
     Returns:
         List[FormViolation]: List of violations found
@@ -368,55 +448,14 @@ def check_hip_angle(angles: Dict[str, List[float]]) -> List[FormViolation]:
 
     violations = []
 
-    hip_left = angles.get('hip_left', [])
-    hip_right = angles.get('hip_right', [])
-
-    # Average both sides
-    if hip_left and hip_right:
-        hip_left_filtered = _filter_outliers(hip_left)
-        hip_right_filtered = _filter_outliers(hip_right)
-        hip_angles = _average_bilateral(hip_left_filtered, hip_right_filtered)
-    elif hip_left:
-        hip_angles = _filter_outliers(hip_left)
-    elif hip_right:
-        hip_angles = _filter_outliers(hip_right)
-    else:
-        return violations
+    prep = angles if isinstance(angles, AnglePrep) else prepare_angles(angles)
 
-    valid_hip = [x for x in hip_angles if x is not None]
-    if not valid_hip:
+    min_hip = prep.hip_min
+    if np.isnan(min_hip):
         return violations
 
-    min_hip = min(valid_hip)
-
     # Evaluate hip flexion zones
-    if min_hip >= HIP_ANGLE_CONFIG['ideal_min']:
-        violations.append(FormViolation(
-            rule_name='hip_angle_good',
-            severity=Severity.LOW,
-            passed=True,
-            score_penalty=0,
-            feedback=f'Good hip depth ({min_hip:.0f}°)',
-            details={'min_hip': min_hip}
-        ))
-    elif HIP_ANGLE_CONFIG['danger_threshold'] <= min_hip < HIP_ANGLE_CONFIG['watch_threshold']:
-        violations.append(FormViolation(
-            rule_name='hip_angle_deep',
-            severity=Severity.MEDIUM,
-            passed=False,
-            score_penalty=5,
-            feedback=f'Deep hip flexion ({min_hip:.0f}°) - watch for posterior pelvic tilt',
-            details={'min_hip': min_hip}
-        ))
-    elif min_hip < HIP_ANGLE_CONFIG['danger_threshold']:
-        violations.append(FormViolation(
-            rule_name='hip_angle_excessive',
-            severity=Severity.HIGH,
-            passed=False,
-            score_penalty=15,
-            feedback=f'Excessive hip flexion ({min_hip:.0f}°) - likely causing spine rounding',
-            details={'min_hip': min_hip}
-        ))
+    violations.extend(_zone_violation(_HIP_BOUNDS, _HIP_ZONES, min_hip, 'min_hip'))
 
     return violations
 
@@ -467,10 +506,13 @@ def evaluate_form(angles: Dict[str, List[float]]) -> List[FormViolation]:
 
     all_violations = []
 
+    # Filter, average and reduce once; the checks only compare and build violations
+    prep = prepare_angles(angles)
+
     # Run all rule checks (order by priority)
-    all_violations.extend(check_spine_neutral(angles))
-    all_violations.extend(check_squat_depth(angles))
-    all_violations.extend(check_hip_angle(angles))
+    all_violations.extend(check_spine_neutral(prep))
+    all_violations.extend(check_squat_depth(prep))
+    all_violations.extend(check_hip_angle(prep))
     all_violations.extend(check_trunk_inclination(angles))
     all_violations.extend(check_tibia_inclination(angles))
 
@@ -0,0 +1,76 @@
+"""
+Numba-compiled kernels for form rule checks.
+
+Falls back to plain Python when Numba is not installed; form_rules only
+uses these kernels when Numba is available.
+"""
+import math
+
+import numpy as np
+
+from src.utils.numba_compat import njit
+
+
+@njit(cache=True)
+def _spine_scan(back_angles, max_sudden_change, min_consecutive):
+    """Single pass over back angles for the spine neutral checks
+
+    Args:
+        back_angles (np.ndarray): float64 back angles (NaN = missing)
+        max_sudden_change (float): Frame-to-frame change threshold in degrees
+        min_consecutive (int): Minimum run length to report
+
+    Returns:
+        Tuple: (run_starts, run_lengths, run_max_changes, back_min, back_max)
+        for runs of consecutive sudden changes at least min_consecutive long;
+        back_min/back_max are NaN if no frame is valid.
+    """
+    n = back_angles.shape[0]
+    run_starts = np.empty(n, dtype=np.int64)
+    run_lengths = np.empty(n, dtype=np.int64)
+    run_max_changes = np.empty(n, dtype=np.float64)
+    num_runs = 0
+
+    back_min = np.inf
+    back_max = -np.inf
+    run_start = -1
+    run_max = 0.0
+
+    for i in range(n):
+        value = back_angles[i]
+        if not math.isnan(value):
+            back_min = min(back_min, value)
+            back_max = max(back_max, value)
+
+        # Change from frame i to i+1 (missing frames never count)
+        flagged = False
+        if i + 1 < n and not math.isnan(value) and not math.isnan(back_angles[i + 1]):
+            change = abs(back_angles[i + 1] - value)
+            if change > max_sudden_change:
+                flagged = True
+                if run_start < 0:
+                    run_start = i
+                    run_max = change
+                else:
+                    run_max = max(run_max, change)
+
+        # Close the current run on the first unflagged change
+        if not flagged and run_start >= 0:
+            if i - run_start >= min_consecutive:
+                run_starts[num_runs] = run_start
+                run_lengths[num_runs] = i - run_start
+                run_max_changes[num_runs] = run_max
+                num_runs += 1
+            run_start = -1
+
+    if back_min > back_max:
+        back_min = np.nan
+        back_max = np.nan
+
+    return (run_starts[:num_runs], run_lengths[:num_runs],
+            run_max_changes[:num_runs], back_min, back_max)
+
+
+# Compile (or load from cache) at import so the first evaluate_form() is fast.
+# Thresholds are ints, matching the SPINE_NEUTRAL_CONFIG values form_rules passes.
+_spine_scan(np.zeros(2), 20, 2)
@@ -3,20 +3,35 @@ Data models for form analysis
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
-from enum import Enum
+from typing import List, Optional, Dict, Any, Sequence
+from enum import IntEnum
 
+import numpy as np
 
-class Severity(Enum):
-    """Severity levels for form violations"""
+# Minimum score to pass
+PASSING_SCORE = 70
 
-    CRITICAL = 'critical'  # Dangerous, must fix immediately
-    HIGH = 'high'          # Significant form issue
-    MEDIUM = 'medium'      # Should improve
-    LOW = 'low'            # Minor optimization
 
+class Severity(IntEnum):
+    """Severity levels for form violations
 
-@dataclass
+    Values are the priority order (lower = more severe), so violations
+    can be sorted directly by severity.
+    """
+
+    CRITICAL = 0  # Dangerous, must fix immediately
+    HIGH = 1      # Significant form issue
+    MEDIUM = 2    # Should improve
+    LOW = 3       # Minor optimization
+
+    @property
+    def label(self) -> str:
+        """Lowercase display name, e.g. 'critical'"""
+
+        return self.name.lower()
+
+
+@dataclass(slots=True)
 class FormViolation:
     """Represents a single form rule violation
 
@@ -45,47 +60,170 @@ class FormViolation:
             raise ValueError(f'score_penalty must be 0-100, got {self.score_penalty}')
 
 
-@dataclass
-class FormResult:
+class ViolationTable:
+    """Column-oriented view of a list of violations
+
+    Stores each FormViolation field as its own array so scans that only
+    need one or two fields (passed, severity, penalty) run over contiguous
+    memory instead of touching every object.
+
+    Attributes:
+        passed (np.ndarray): Boolean array, True where the rule passed
+        severity (np.ndarray): uint8 array of Severity values
+        penalty (np.ndarray): uint8 array of raw score penalties
+        feedback (np.ndarray): Object array of feedback messages
+        frames (np.ndarray): Object array of frame index lists (or None)
+        details (np.ndarray): Object array of detail dicts (or None)
+    """
+
+    __slots__ = ('passed', 'severity', 'penalty', 'feedback', 'frames', 'details')
+
+    def __init__(self, passed, severity, penalty, feedback, frames, details):
+        self.passed = passed
+        self.severity = severity
+        self.penalty = penalty
+        self.feedback = feedback
+        self.frames = frames
+        self.details = details
+
+    @classmethod
+    def from_list(cls, violations: List[FormViolation]) -> 'ViolationTable':
+        """Build a table from a list of violations
+
+        Args:
+            violations (List[FormViolation]): Violations to convert
+
+        Returns:
+            ViolationTable: Table with one row per violation
+        """
+
+        n = len(violations)
+        feedback = np.empty(n, dtype=object)
+        frames = np.empty(n, dtype=object)
+        details = np.empty(n, dtype=object)
+        feedback[:] = [v.feedback for v in violations]
+        frames[:] = [v.frames for v in violations]
+        details[:] = [v.details for v in violations]
+
+        return cls(
+            passed=np.fromiter((v.passed for v in violations), dtype=bool, count=n),
+            severity=np.fromiter((v.severity for v in violations), dtype=np.uint8, count=n),
+            penalty=np.fromiter((v.score_penalty for v in violations), dtype=np.uint8, count=n),
+            feedback=feedback,
+            frames=frames,
+            details=details,
+        )
+
+    def __len__(self) -> int:
+        return len(self.passed)
+
+    def failed_indices(self) -> np.ndarray:
+        """Get row indices of failed violations
+
+        Returns:
+            np.ndarray: Indices where passed is False
+        """
+
+        return np.flatnonzero(~self.passed)
+
+    def has_critical(self) -> bool:
+        """Check for any failed critical violation
+
+        Returns:
+            bool: True if any row is both critical and failed
+        """
+
+        return bool(((self.severity == Severity.CRITICAL) & ~self.passed).any())
+
+
+class _ViolationCache:
+    """Slots for FormResult's lazily derived views, kept out of its dataclass fields"""
+
+    __slots__ = ('_critical', '_failed', '_table')
+
+
+@dataclass(slots=True)
+class FormResult(_ViolationCache):
     """Overall form analysis result for a squat video
 
+    violations is always a tuple, not a list: any sequence passed in or
+    assigned later is converted, so it cannot be appended to in place.
+    This keeps the cached views derived from it (passed, critical/failed
+    subsets, table) from going stale; assigning a new sequence resets them.
+
     Attributes:
         score (int): Overall score from 0-100
-        violations (List[FormViolation]): List of all violations found
-        passed (bool): Whether form is acceptable overall
+        violations (Sequence[FormViolation]): All violations found, as a tuple
         feedback_summary (List[str]): Top prioritized feedback items
         details (Dict[str, Any]): Additional information
     """
 
     score: int
-    violations: List[FormViolation]
-    passed: bool
+    violations: Sequence[FormViolation]
     feedback_summary: List[str]
     details: Dict[str, Any] = field(default_factory=dict)
 
+    def __setattr__(self, name: str, value: Any):
+        """Freeze violations and drop caches derived from the old ones"""
+
+        if name == 'violations':
+            value = tuple(value)
+            object.__setattr__(self, '_critical', None)
+            object.__setattr__(self, '_failed', None)
+            object.__setattr__(self, '_table', None)
+        object.__setattr__(self, name, value)
+
     def __post_init__(self):
         """Validate data after initialization"""
 
         if not 0 <= self.score <= 100:
             raise ValueError(f'score must be 0-100, got {self.score}')
 
+    @property
+    def passed(self) -> bool:
+        """Whether form is acceptable overall
+
+        Derived from the score and violations so it can never disagree
+        with them: the score must reach PASSING_SCORE and no critical
+        violation may have failed.
+        """
+
+        return self.score >= PASSING_SCORE and not self.has_critical_issues()
+
+    @property
+    def table(self) -> ViolationTable:
+        """Column-oriented view of violations, built on first access"""
+
+        if self._table is None:
+            self._table = ViolationTable.from_list(self.violations)
+        return self._table
+
     def get_critical_violations(self) -> List[FormViolation]:
         """Get only critical severity violations
 
+        Computed on first call and cached.
+
         Returns:
             List[FormViolation]: Critical violations that failed
         """
 
-        return [v for v in self.violations if v.severity == Severity.CRITICAL and not v.passed]
+        if self._critical is None:
+            self._critical = [v for v in self.violations if v.severity is Severity.CRITICAL and not v.passed]
+        return self._critical
 
     def get_failed_violations(self) -> List[FormViolation]:
         """Get all violations that failed
 
+        Computed on first call and cached.
+
         Returns:
             List[FormViolation]: All violations with passed=False
         """
 
-        return [v for v in self.violations if not v.passed]
+        if self._failed is None:
+            violations = self.violations
+            self._failed = [violations[i] for i in self.table.failed_indices()]
+        return self._failed
 
     def has_critical_issues(self) -> bool:
         """Check if there are any critical violations
@@ -94,4 +232,6 @@ class FormResult:
             bool: True if any critical violations exist
         """
 
-        return len(self.get_critical_violations()) > 0
+        if self._critical is not None:
+            return len(self._critical) > 0
+        return self.table.has_critical()
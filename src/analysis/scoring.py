@@ -2,8 +2,11 @@
 Scoring algorithm for squat form analysis
 """
 
-from typing import List, Dict
-from .models import FormViolation, Severity
+import numpy as np
+from typing import List, Dict, Union
+from src.utils.numba_compat import NUMBA_AVAILABLE
+from .models import FormViolation, Severity, ViolationTable, PASSING_SCORE
+from .scoring_numba import _deduct_penalties
 
 # Penalty weights by severity level
 SEVERITY_WEIGHTS = {
@@ -13,30 +16,41 @@ SEVERITY_WEIGHTS = {
     Severity.LOW: 0.5
 }
 
-# Minimum score to pass
-PASSING_SCORE = 70
+# SEVERITY_WEIGHTS indexed by Severity value, for vectorized lookups
+_WEIGHTS = np.array([SEVERITY_WEIGHTS[severity] for severity in Severity], dtype=np.float64)
 
 
-def calculate_score(violations: List[FormViolation]) -> int:
+def _as_table(violations: Union[List[FormViolation], ViolationTable]) -> ViolationTable:
+    """Return violations as a ViolationTable, converting a list if needed"""
+
+    if isinstance(violations, ViolationTable):
+        return violations
+    return ViolationTable.from_list(violations)
+
+
+def calculate_score(violations: Union[List[FormViolation], ViolationTable]) -> int:
     """Calculate overall form score from 0-100
 
     Starts at 100 and deducts weighted penalties for each violation
 
     Args:
-        violations (List[FormViolation]): List of form violations from rule evaluation
+        violations (Union[List[FormViolation], ViolationTable]): Form violations
+            from rule evaluation, as a list or a ViolationTable
 
     Returns:
         int: Score from 0-100 (90-100 excellent, 75-89 good, 60-74 fair, <60 poor)
     """
 
-    score = 100
+    table = _as_table(violations)
 
-    # Deduct weighted penalties for failed rules
-    for violation in violations:
-        if not violation.passed:
-            weight = SEVERITY_WEIGHTS[violation.severity]
-            penalty = violation.score_penalty * weight
-            score -= penalty
+    # Deduct weighted penalties for failed rules, one by one in order
+    if NUMBA_AVAILABLE:
+        score = _deduct_penalties(table.penalty, table.severity, table.passed, _WEIGHTS)
+    else:
+        # subtract.reduce folds left to right, matching the compiled loop exactly
+        failed = ~table.passed
+        penalties = table.penalty[failed] * _WEIGHTS[table.severity[failed]]
+        score = np.subtract.reduce(np.concatenate(([100.0], penalties)))
 
     # Clamp to valid range
     return max(0, min(100, int(score)))
@@ -99,31 +113,23 @@ def get_score_description(score: int) -> str:
         return 'Dangerous form - high injury risk'
 
 
-def get_violation_summary(violations: List[FormViolation]) -> Dict[str, int]:
+def get_violation_summary(violations: Union[List[FormViolation], ViolationTable]) -> Dict[str, int]:
     """Get summary statistics about violations
 
     Args:
-        violations (List[FormViolation]): List of violations
+        violations (Union[List[FormViolation], ViolationTable]): Violations,
+            as a list or a ViolationTable
 
     Returns:
         dict: Counts by severity level
     """
 
-    summary = {
-        'total': len(violations),
-        'critical': 0,
-        'high': 0,
-        'medium': 0,
-        'low': 0,
-        'passed': 0
-    }
-
-    for violation in violations:
-        if violation.passed:
-            summary['passed'] += 1
-        else:
-            severity_name = violation.severity.value
-            if severity_name in summary:
-                summary[severity_name] += 1
+    table = _as_table(violations)
+    failed = ~table.passed
+    counts = np.bincount(table.severity[failed], minlength=len(Severity)).tolist()
+
+    summary = {'total': len(table)}
+    summary.update((severity.label, counts[severity]) for severity in Severity)
+    summary['passed'] = len(table) - int(failed.sum())
 
     return summary
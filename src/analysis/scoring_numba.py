@@ -0,0 +1,38 @@
+"""
+Numba-compiled kernels for scoring.
+
+Falls back to plain Python when Numba is not installed; scoring only
+uses these kernels when Numba is available.
+"""
+import numpy as np
+
+from src.utils.numba_compat import njit
+
+
+@njit(cache=True)
+def _deduct_penalties(penalty, severity, passed, weights):
+    """Score left after deducting weighted penalties of failed violations
+
+    Deducts one violation at a time, in order, from a starting score of 100.
+
+    Args:
+        penalty (np.ndarray): uint8 raw penalties per violation
+        severity (np.ndarray): uint8 Severity values per violation
+        passed (np.ndarray): bool, True where the rule passed
+        weights (np.ndarray): float64 weight per Severity value
+
+    Returns:
+        float: Unclamped score
+    """
+    score = 100.0
+    for i in range(penalty.shape[0]):
+        if not passed[i]:
+            score -= penalty[i] * weights[severity[i]]
+    return score
+
+
+# Compile (or load from cache) at import so the first real call is fast
+_deduct_penalties(
+    np.zeros(1, dtype=np.uint8), np.zeros(1, dtype=np.uint8),
+    np.zeros(1, dtype=np.bool_), np.ones(4)
+)
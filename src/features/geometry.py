@@ -1,8 +1,11 @@
 """
 Geometric calculations for pose analysis.
 """
+import math
 import numpy as np
 from typing import Any
+from src.utils.numba_compat import NUMBA_AVAILABLE
+from src.features.geometry_numba import _angle, _frame_angles, DEGENERATE_ANGLE
 
 def calculate_angle(point_a: Any, point_b: Any, point_c: Any) -> float:
     """Calculates angle between three MediaPipe landmark points
@@ -15,25 +18,112 @@ def calculate_angle(point_a: Any, point_b: Any, point_c: Any) -> float:
     Returns:
         float: calculated angle between the three landmark points in degrees (0-180)
     """
-    # Extract coordinates
-    a = np.array([point_a.x, point_a.y, point_a.z])
-    b = np.array([point_b.x, point_b.y, point_b.z])
-    c = np.array([point_c.x, point_c.y, point_c.z])
-    
-    # Create BA and BC vectors
-    ba = a - b
-    bc = c - b
-    
-    if np.linalg.norm(ba) == 0 or np.linalg.norm(bc) == 0:
+    angle = _angle(
+        point_a.x, point_a.y, point_a.z,
+        point_b.x, point_b.y, point_b.z,
+        point_c.x, point_c.y, point_c.z
+    )
+
+    if angle == DEGENERATE_ANGLE:
+        raise ValueError("Divide by vector with magnitude 0")
+
+    return angle
+
+
+def calculate_vertical_angle(point_a: Any, point_b: Any) -> float:
+    """Calculates angle between the B->A vector and straight down in the image
+
+    Same result as calculate_angle(point_a, point_b, point_below_b) with a
+    reference point directly below B (image y increases downward), without
+    building the reference point or normalizing a second vector.
+
+    Args:
+        point_a (MediaPipe_landmark): first landmark (e.g. shoulder)
+        point_b (MediaPipe_landmark): vertex landmark (e.g. hip)
+
+    Returns:
+        float: angle from vertical in degrees (0 = A directly below B, 180 = directly above)
+    """
+    dx = point_a.x - point_b.x
+    dy = point_a.y - point_b.y
+    dz = point_a.z - point_b.z
+
+    if dx == 0 and dy == 0 and dz == 0:
         raise ValueError("Divide by vector with magnitude 0")
-    # Calculate the cosine of the angle using the dot product
-    cos_theta = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
+
+    return math.degrees(math.atan2(math.hypot(dx, dz), dy))
+
+
+def calculate_vertical_angles_batch(points_a: np.ndarray, points_b: np.ndarray) -> np.ndarray:
+    """Calculates calculate_vertical_angle() for many landmark pairs at once
+
+    Args:
+        points_a (np.ndarray): (N, 3) coordinates of the first landmarks
+        points_b (np.ndarray): (N, 3) coordinates of the vertex landmarks
+
+    Returns:
+        np.ndarray: (N,) angles from vertical in degrees (0-180), NaN where A and B coincide
+    """
+    d = np.asarray(points_a) - np.asarray(points_b)
+    angles = np.degrees(np.arctan2(np.hypot(d[..., 0], d[..., 2]), d[..., 1]))
+
+    # Zero-length vectors have no defined angle
+    return np.where(d.any(axis=-1), angles, np.nan)
+
+
+def calculate_angles_batch(points_a: np.ndarray, points_b: np.ndarray, points_c: np.ndarray) -> np.ndarray:
+    """Calculates angles for many landmark triplets at once
+
+    Vectorized counterpart of calculate_angle() for arrays of coordinates,
+    e.g. one row per frame or one row per joint.
+
+    Args:
+        points_a (np.ndarray): (N, 3) coordinates of the first landmarks
+        points_b (np.ndarray): (N, 3) coordinates of the middle landmarks (angle vertex)
+        points_c (np.ndarray): (N, 3) coordinates of the third landmarks
+
+    Returns:
+        np.ndarray: (N,) angles in degrees (0-180), NaN where a vector has magnitude 0
+    """
+    # Create BA and BC vectors
+    ba = np.asarray(points_a) - np.asarray(points_b)
+    bc = np.asarray(points_c) - np.asarray(points_b)
+
+    # einsum reduces each row in one pass, without the (N, 3) products
+    # np.linalg.norm and ba * bc would allocate first
+    norms = np.sqrt(np.einsum('...i,...i->...', ba, ba)) * np.sqrt(np.einsum('...i,...i->...', bc, bc))
+    dots = np.einsum('...i,...i->...', ba, bc)
+
+    # Zero-length vectors have no defined angle
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_theta = np.where(norms > 0, dots / norms, np.nan)
+
     # Clip to handle floating point errors
     cos_theta = np.clip(cos_theta, -1.0, 1.0)
-    
-    # Convert to angle in degrees
-    theta = np.arccos(cos_theta)
-    angle = np.degrees(theta)
-    
-    return angle
-    
+
+    return np.degrees(np.arccos(cos_theta))
+
+
+def calculate_frame_angles(landmarks: np.ndarray, angle_idx: np.ndarray, min_visibility: float) -> np.ndarray:
+    """Calculates every configured joint angle of one frame
+
+    Uses the compiled per-frame kernel when Numba is installed, otherwise
+    calculate_angles_batch() on the gathered landmarks.
+
+    Args:
+        landmarks (np.ndarray): (N, 4) float64 landmark rows of x, y, z, visibility
+        angle_idx (np.ndarray): (M, 3) landmark indices (A, B, C) per angle, B is the vertex
+        min_visibility (float): Minimum visibility required for all three landmarks
+
+    Returns:
+        np.ndarray: (M,) angles in degrees (0-180), NaN where a landmark is not
+        visible enough or a vector has magnitude 0
+    """
+    if NUMBA_AVAILABLE:
+        return _frame_angles(landmarks, angle_idx, min_visibility)
+
+    points = landmarks[angle_idx]
+    angles = calculate_angles_batch(points[:, 0, :3], points[:, 1, :3], points[:, 2, :3])
+    angles[~(points[:, :, 3] >= min_visibility).all(axis=1)] = np.nan
+
+    return angles
@@ -0,0 +1,86 @@
+"""
+Numba-compiled kernels for scalar geometry calculations.
+
+Falls back to plain Python when Numba is not installed.
+"""
+import math
+
+import numpy as np
+
+from src.utils.numba_compat import njit
+
+# Returned by _angle() when one of the vectors has magnitude 0
+DEGENERATE_ANGLE = -1.0
+
+
+@njit(cache=True)
+def _angle(ax: float, ay: float, az: float,
+           bx: float, by: float, bz: float,
+           cx: float, cy: float, cz: float) -> float:
+    """Angle ABC in degrees from raw coordinates
+
+    Returns:
+        float: angle in degrees (0-180), or DEGENERATE_ANGLE if BA or BC has length 0
+    """
+    # Create BA and BC vectors
+    v1x = ax - bx
+    v1y = ay - by
+    v1z = az - bz
+    v2x = cx - bx
+    v2y = cy - by
+    v2z = cz - bz
+
+    n1 = math.sqrt(v1x * v1x + v1y * v1y + v1z * v1z)
+    n2 = math.sqrt(v2x * v2x + v2y * v2y + v2z * v2z)
+    if n1 == 0.0 or n2 == 0.0:
+        return DEGENERATE_ANGLE
+
+    dot = v1x * v2x + v1y * v2y + v1z * v2z
+    cos_theta = dot / (n1 * n2)
+    # Clip to handle floating point errors, letting NaN through like np.clip
+    if cos_theta > 1.0:
+        cos_theta = 1.0
+    elif cos_theta < -1.0:
+        cos_theta = -1.0
+
+    return math.degrees(math.acos(cos_theta))
+
+
+@njit(cache=True)
+def _frame_angles(landmarks, angle_idx, min_visibility):
+    """All joint angles of one frame in a single compiled call
+
+    Args:
+        landmarks (np.ndarray): (N, 4) float64 rows of x, y, z, visibility
+        angle_idx (np.ndarray): (M, 3) landmark indices (A, B, C) per angle
+        min_visibility (float): Minimum visibility of all three landmarks
+
+    Returns:
+        np.ndarray: (M,) angles in degrees, NaN where a landmark is not
+        visible enough or a vector has magnitude 0
+    """
+    n_angles = angle_idx.shape[0]
+    angles = np.empty(n_angles, dtype=np.float64)
+
+    for i in range(n_angles):
+        a = angle_idx[i, 0]
+        b = angle_idx[i, 1]
+        c = angle_idx[i, 2]
+
+        if (landmarks[a, 3] >= min_visibility and landmarks[b, 3] >= min_visibility
+                and landmarks[c, 3] >= min_visibility):
+            angle = _angle(
+                landmarks[a, 0], landmarks[a, 1], landmarks[a, 2],
+                landmarks[b, 0], landmarks[b, 1], landmarks[b, 2],
+                landmarks[c, 0], landmarks[c, 1], landmarks[c, 2]
+            )
+            angles[i] = np.nan if angle == DEGENERATE_ANGLE else angle
+        else:
+            angles[i] = np.nan
+
+    return angles
+
+
+# Compile (or load from cache) at import so the first real call is fast
+_angle(1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+_frame_angles(np.zeros((3, 4)), np.zeros((1, 3), dtype=np.intp), 0.5)
@@ -3,12 +3,47 @@ MediaPipe wrapper for single frame pose detection
 """
 import mediapipe as mp
 import numpy as np
-from typing import Optional, List
+from dataclasses import dataclass
+from typing import Any, Optional
 
 # Default confidence thresholds
 MIN_DETECTION_CONFIDENCE = 0.5
 MIN_TRACKING_CONFIDENCE = 0.5
 
+# Default pose model (0 = Lite, 1 = Full, 2 = Heavy)
+MODEL_COMPLEXITY = 1
+
+
+def landmarks_to_array(landmarks) -> np.ndarray:
+    """Copy MediaPipe landmarks into a (N, 4) array of x, y, z, visibility.
+
+    Reading the protobuf fields once per frame lets all later angle and
+    visibility math run on plain NumPy arrays.
+
+    Args:
+        landmarks: Sequence of MediaPipe landmarks (e.g. pose_landmarks.landmark)
+
+    Returns:
+        float64 array with one row per landmark: columns x, y, z, visibility
+    """
+    return np.array(
+        [(lm.x, lm.y, lm.z, lm.visibility) for lm in landmarks],
+        dtype=np.float64
+    ).reshape(-1, 4)
+
+
+@dataclass(slots=True)
+class PoseResult:
+    """Pose detected in one frame.
+
+    Attributes:
+        landmarks: (33, 4) array of x, y, z, visibility per landmark
+        pose_landmarks: MediaPipe pose_landmarks proto, for drawing the skeleton
+    """
+
+    landmarks: np.ndarray
+    pose_landmarks: Any
+
 
 class PoseDetector:
     """Wrapper for MediaPipe Pose detection.
@@ -20,28 +55,44 @@ class PoseDetector:
     def __init__(
         self,
         min_detection_confidence: float = MIN_DETECTION_CONFIDENCE,
-        min_tracking_confidence: float = MIN_TRACKING_CONFIDENCE
+        min_tracking_confidence: float = MIN_TRACKING_CONFIDENCE,
+        model_complexity: int = MODEL_COMPLEXITY,
+        smooth_landmarks: bool = True,
+        static_image_mode: bool = False
     ):
         """Initialize the pose detector.
 
         Args:
             min_detection_confidence: Minimum confidence for person detection (0.0-1.0)
             min_tracking_confidence: Minimum confidence for landmark tracking (0.0-1.0)
+            model_complexity: Pose model size. 0 (Lite) is roughly twice as
+                fast as 1 (Full) at some cost in landmark accuracy; 2 (Heavy)
+                is the most accurate and slowest.
+            smooth_landmarks: Filter landmarks across frames to reduce jitter
+                (video only)
+            static_image_mode: Run person detection on every frame. Keep False
+                for video so landmarks are tracked between frames, which is
+                both faster and steadier.
         """
         self.pose = mp.solutions.pose.Pose(
+            static_image_mode=static_image_mode,
+            model_complexity=model_complexity,
+            smooth_landmarks=smooth_landmarks,
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence
         )
 
-    def detect(self, frame: np.ndarray) -> Optional[List]:
+    def detect(self, frame: np.ndarray) -> Optional[PoseResult]:
         """Detect pose landmarks in an RGB frame.
 
+        Runs inference once and returns both the landmark array for angle
+        math and the MediaPipe proto for drawing.
+
         Args:
             frame: RGB image as numpy array (H, W, 3)
 
         Returns:
-            List of 33 MediaPipe landmarks if pose detected, None otherwise.
-            Each landmark has x, y, z coordinates and visibility score.
+            PoseResult if a pose was detected, None otherwise.
 
         Note:
             Frame must be in RGB format. If using OpenCV (BGR), convert first:
@@ -50,22 +101,19 @@ class PoseDetector:
         results = self.pose.process(frame)
 
         if results.pose_landmarks:
-            return results.pose_landmarks.landmark
+            return PoseResult(
+                landmarks=landmarks_to_array(results.pose_landmarks.landmark),
+                pose_landmarks=results.pose_landmarks
+            )
 
         return None
-    
-    def detect_with_landmarks(self, frame: np.ndarray):
-        """Process RGB frame and return full pose_landmarks object or None.
-          
-        Use this when you need to draw the pose skeleton.
-        
-        Returns:
-            pose_landmarks object (has .landmark attribute) or None
-        """
-        results = self.pose.process(frame)
-        return results.pose_landmarks 
+
+    def close(self):
+        """Release MediaPipe resources. Safe to call more than once."""
+        if getattr(self, 'pose', None):
+            self.pose.close()
+            self.pose = None
 
     def __del__(self):
         """Clean up MediaPipe resources."""
-        if hasattr(self, 'pose') and self.pose:
-            self.pose.close()
+        self.close()
@@ -2,16 +2,24 @@
 End-to-end video processing pipeline
 """
 import cv2
+import math
 import numpy as np
 import mediapipe as mp
-from typing import Optional, Dict, Any, List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Queue, Empty, Full
+from threading import Event, Thread
+from typing import Optional, Dict, Any
 from src.utils.video_io import (read_video, 
                                 write_video, 
+                                VideoSink,
                                 get_video_info, 
+                                get_capture_info,
                                 iterate_frames, 
+                                iterate_capture,
                                 extract_frames)
-from src.features.geometry import calculate_angle
-from src.pose.detector import PoseDetector
+from src.features.geometry import calculate_frame_angles
+from src.pose.detector import PoseDetector, MODEL_COMPLEXITY
 
 ANGLES_CONFIG = [
     {
@@ -52,12 +60,61 @@ ANGLES_CONFIG = [
     },
 ]
 
+# ANGLES_CONFIG as parallel module constants, so the per-frame loop does no
+# dict lookups. _ANGLE_IDX has one row of (A, B, C) landmark indices per angle.
+_ANGLE_IDX = np.array([c['landmarks'] for c in ANGLES_CONFIG], dtype=np.intp)
+_ANGLE_NAMES = tuple(c['name'] for c in ANGLES_CONFIG)
+_ANGLE_DISPLAY = tuple(c['display'] for c in ANGLES_CONFIG)
+_ANGLE_COLORS = tuple(c['color'] for c in ANGLES_CONFIG)
+# Text origin of each angle label line on annotated frames
+_LABEL_ORIGINS = tuple((10, 30 + 30 * i) for i in range(len(ANGLES_CONFIG)))
+
+# Frames buffered between consecutive pipeline stages
+QUEUE_SIZE = 8
+
+# Threads drawing annotations for the output video
+ANNOTATION_WORKERS = 2
+
+# Grayscale thumbnail size (width, height) compared by the motion gate
+MOTION_SIZE = (64, 36)
+
+
+def _put(queue: Queue, item: Any, stop: Event) -> bool:
+    """
+    Put an item on a bounded queue, giving up once stop is set.
+    
+    Returns:
+        True if the item was queued, False if the pipeline was stopped
+    """
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=0.1)
+            return True
+        except Full:
+            pass
+    return False
+
+
+def _get(queue: Queue, stop: Event) -> Any:
+    """
+    Get the next item from a queue, or None once stop is set.
+    """
+    while not stop.is_set():
+        try:
+            return queue.get(timeout=0.1)
+        except Empty:
+            pass
+    return None
+
+
 def process_video(
     video_path: str,
     output_path: Optional[str] = None,
     frame_skip: int = 0,
     visualize: bool = True,
-    min_visibility: float = 0.7
+    min_visibility: float = 0.7,
+    model_complexity: int = MODEL_COMPLEXITY,
+    motion_threshold: float = 0.0
 ) -> Dict[str, Any]:
     """
     Process a video through pose detection and angle extraction.
@@ -66,8 +123,16 @@ def process_video(
         video_path: Path to input video
         output_path: Optional path to save annotated video
         frame_skip: Number of frames to skip (0 = process all)
-        visualize: Whether to draw pose skeleton on frames
+        visualize: Whether to draw pose skeleton on frames. Drawing only
+            happens when output_path is also set; otherwise the run is
+            detection-only and no frames are copied or annotated.
         min_visibility: Minimum visibility for pose landmarks to be considered
+        model_complexity: MediaPipe pose model (0 = Lite, 1 = Full, 2 = Heavy).
+            Lite is about twice as fast and is usually enough for joint angles.
+        motion_threshold: Skip inference on frames whose mean absolute
+            difference from the last inferred frame (64x36 grayscale, 0-255)
+            is below this value, reusing that frame's pose. Speeds up videos
+            with idle stretches; 0 disables the gate and runs every frame.
         
     Returns:
         Dictionary containing:
@@ -76,101 +141,236 @@ def process_video(
         - 'frames_processed': Number of frames analyzed
         - 'poses_detected': Number of successful detections
     """
+    cap = read_video(video_path)
+    
+    try:
+        return process_video_capture(
+            cap,
+            output_path=output_path,
+            frame_skip=frame_skip,
+            visualize=visualize,
+            min_visibility=min_visibility,
+            model_complexity=model_complexity,
+            motion_threshold=motion_threshold
+        )
+    finally:
+        cap.release()
+
+
+def process_video_capture(
+    cap: cv2.VideoCapture,
+    output_path: Optional[str] = None,
+    frame_skip: int = 0,
+    visualize: bool = True,
+    min_visibility: float = 0.7,
+    model_complexity: int = MODEL_COMPLEXITY,
+    motion_threshold: float = 0.0
+) -> Dict[str, Any]:
+    """
+    Process an already opened video through pose detection and angle extraction.
+    
+    Same as process_video(), but reads from the capture's current position
+    and leaves it open, so one capture can be rewound and reused across runs.
+      
+    Args:
+        cap: Opened cv2 VideoCapture
+        output_path: Optional path to save annotated video
+        frame_skip: Number of frames to skip (0 = process all)
+        visualize: Whether to draw pose skeleton on frames (requires output_path)
+        min_visibility: Minimum visibility for pose landmarks to be considered
+        model_complexity: MediaPipe pose model (0 = Lite, 1 = Full, 2 = Heavy).
+            Lite is about twice as fast and is usually enough for joint angles.
+        motion_threshold: Skip inference on frames whose mean absolute
+            difference from the last inferred frame (64x36 grayscale, 0-255)
+            is below this value, reusing that frame's pose. Speeds up videos
+            with idle stretches; 0 disables the gate and runs every frame.
+        
+    Returns:
+        Same dictionary as process_video()
+    """
     # Initialize PoseDetector and get video metadata
-    detector = PoseDetector()
-    metadata = get_video_info(video_path)
+    detector = PoseDetector(model_complexity=model_complexity)
+    metadata = get_capture_info(cap)
     
     angles_data = []
     frames_processed = 0
     poses_detected = 0
-    output_frames = []
+    # Annotated frames are only consumed by the output video
+    draw = visualize and output_path is not None
     
-    if visualize:
-        mp_pose = mp.solutions.pose
+    if draw:
         mp_drawing = mp.solutions.drawing_utils
-        mp_drawing_styles = mp.solutions.drawing_styles
+        # Built once; draw_landmarks only reads them
+        pose_connections = mp.solutions.pose.POSE_CONNECTIONS
+        pose_style = mp.solutions.drawing_styles.get_default_pose_landmarks_style()
     
-    def check_visibility(landmarks, indices: List) -> bool:
+    # Frames are streamed to the output as they are produced (opened on the first frame)
+    sink = VideoSink(output_path, int(metadata['fps']), codec='mp4v') if draw else None
+    
+    # Decode, inference and post-processing run as three stages connected by
+    # bounded FIFO queues, so frame order is preserved. Inference stays on the
+    # calling thread, which owns the MediaPipe graph.
+    decoded = Queue(maxsize=QUEUE_SIZE)
+    detected = Queue(maxsize=QUEUE_SIZE)
+    stop = Event()
+    errors = []
+    
+    def decode():
         """
-        Helper function to check landmark visibility above min_visibility
+        Stage 1: read frames and convert them to RGB for MediaPipe
         """
-        return all(landmarks[i].visibility >= min_visibility for i in indices)
-
-    # Loop through all frames in the cideo
-    for frame in iterate_frames(video_path, frame_skip):
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        # Gets MediaPipe pose_landmarks object
-        pose_landmarks = detector.detect_with_landmarks(frame_rgb)
+        # Reusable RGB buffers: one per queued frame, plus the one in inference
+        # and the one being filled here
+        rgb_buffers = [None] * (QUEUE_SIZE + 2)
+        try:
+            for i, frame in enumerate(iterate_capture(cap, frame_skip)):
+                slot = i % len(rgb_buffers)
+                frame_rgb = rgb_buffers[slot]
+                if frame_rgb is None or frame_rgb.shape != frame.shape:
+                    frame_rgb = rgb_buffers[slot] = np.empty_like(frame)
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame_rgb)
+                # Thumbnail for the motion gate, made here to keep it off the inference thread
+                small = None
+                if motion_threshold > 0:
+                    small = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), MOTION_SIZE, interpolation=cv2.INTER_AREA)
+                if not _put(decoded, (frame, frame_rgb, small), stop):
+                    return
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            # None marks the end of the stream
+            _put(decoded, None, stop)
+    
+    # Drawing runs on a small thread pool (OpenCV releases the GIL) while the
+    # post-processing thread keeps computing angles. Annotated frames wait in
+    # pending, oldest first; frames without a pose are stored as-is.
+    annotator = ThreadPoolExecutor(max_workers=ANNOTATION_WORKERS) if draw else None
+    pending = deque()
+    # Reusable output buffers: at most QUEUE_SIZE + 1 annotated frames are
+    # pending at once, and a buffer is free again once its frame is written
+    annotated_buffers = [None] * (QUEUE_SIZE + 1)
+    
+    def annotate(frame, annotated_frame, pose_landmarks, frame_angles):
+        """
+        Draw the pose skeleton and angle labels on a copy of the frame
+        """
+        np.copyto(annotated_frame, frame)
         
-        if not pose_landmarks:
-            frames_processed += 1
-            if visualize:
-                output_frames.append(frame)
-            continue
+        mp_drawing.draw_landmarks(
+            annotated_frame,
+            pose_landmarks,
+            pose_connections,
+            landmark_drawing_spec=pose_style
+        )
         
-        landmarks = pose_landmarks.landmark
-        frame_angles = {}
+        # Add text for all angles, stacking the labels that are present
+        line = 0
+        for name, display, color in zip(_ANGLE_NAMES, _ANGLE_DISPLAY, _ANGLE_COLORS):
+            angle_value = frame_angles[name]
 
-        for angle_config in ANGLES_CONFIG:
-            # Check visibility
-            if check_visibility(landmarks, angle_config['landmarks']):
-                # Calculate angle
-                angle = calculate_angle(
-                    landmarks[angle_config['landmarks'][0]],
-                    landmarks[angle_config['landmarks'][1]],
-                    landmarks[angle_config['landmarks'][2]]
+            if angle_value is not None:
+                cv2.putText(
+                    annotated_frame,
+                    f"{display}: {angle_value:.1f} deg",
+                    _LABEL_ORIGINS[line],
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.7,
+                    color,
+                    2
                 )
-                frame_angles[angle_config['name']] = angle
-            else:
-                frame_angles[angle_config['name']] = None
+                line += 1
         
-        # Append annotated frame if visualize=True
-        if visualize:
-            annotated_frame = frame.copy()
-            
-            mp_drawing.draw_landmarks(
-                annotated_frame,
-                pose_landmarks,
-                mp_pose.POSE_CONNECTIONS,
-                landmark_drawing_spec=mp_drawing_styles.get_default_pose_landmarks_style()
-            )
-            
-            # Add text for all angles
-            y_position = 30
-            for angle_config in ANGLES_CONFIG:
-                angle_value = frame_angles.get(angle_config['name'])
-
-                if angle_value is not None:
-                    cv2.putText(
-                        annotated_frame,
-                        f"{angle_config['display']}: {angle_value:.1f} deg",
-                        (10, y_position),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.7,
-                        angle_config['color'],
-                        2
-                    )
-                    y_position += 30
-            
-            output_frames.append(annotated_frame)
+        return annotated_frame
+    
+    def write_ready(max_pending: int):
+        """
+        Write the oldest frames until at most max_pending are waiting
+        """
+        while len(pending) > max_pending:
+            item = pending.popleft()
+            sink.write(item.result() if isinstance(item, Future) else item)
+    
+    def postprocess():
+        """
+        Stage 3: compute angles, then annotate and write each frame
+        """
+        nonlocal frames_processed, poses_detected
+        try:
+            while (item := _get(detected, stop)) is not None:
+                frame, pose = item
+                
+                if pose is None:
+                    frames_processed += 1
+                    if sink is not None:
+                        pending.append(frame)
+                        write_ready(QUEUE_SIZE)
+                    continue
+                
+                # All angles in one call; NaN = not visible or zero-length vector
+                angles = calculate_frame_angles(pose.landmarks, _ANGLE_IDX, min_visibility).tolist()
+                frame_angles = {
+                    name: None if math.isnan(angle) else angle
+                    for name, angle in zip(_ANGLE_NAMES, angles)
+                }
+                
+                # Annotate on the drawing pool; frames are written in submission order
+                if sink is not None:
+                    slot = poses_detected % len(annotated_buffers)
+                    annotated_frame = annotated_buffers[slot]
+                    if annotated_frame is None or annotated_frame.shape != frame.shape:
+                        annotated_frame = annotated_buffers[slot] = np.empty_like(frame)
+                    pending.append(annotator.submit(annotate, frame, annotated_frame, pose.pose_landmarks, frame_angles))
+                    write_ready(QUEUE_SIZE)
+                    
+                frames_processed += 1
+                poses_detected += 1
+                
+                # Store data after frame count incremented
+                angles_data.append({
+                    "frame": frames_processed,
+                    **frame_angles  # Unpack all angles into dict
+                })
             
-        frames_processed += 1
-        poses_detected += 1
-        
-        # Store data after frame count incremented
-        angles_data.append({
-            "frame": frames_processed,
-            **frame_angles  # Unpack all angles into dict
-        })
-        
-    # Write output video
-    if visualize and output_path and output_frames:
-        write_video(
-            output_path,
-            output_frames,
-            fps=int(metadata['fps']),
-            codec='mp4v'
-        )
+            if sink is not None:
+                write_ready(0)
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            if annotator is not None:
+                annotator.shutdown(cancel_futures=True)
+    
+    workers = [Thread(target=decode, daemon=True), Thread(target=postprocess, daemon=True)]
+    for worker in workers:
+        worker.start()
+    
+    try:
+        # Stage 2: pose inference
+        pose = None
+        last_small = None
+        while (item := _get(decoded, stop)) is not None:
+            frame, frame_rgb, small = item
+            # Near-static frame: keep the pose of the last inferred frame
+            if last_small is None or cv2.absdiff(small, last_small).mean() >= motion_threshold:
+                # Single inference gives both the landmark array and the proto for drawing
+                pose = detector.detect(frame_rgb)
+                last_small = small
+            if not _put(detected, (frame, pose), stop):
+                break
+        _put(detected, None, stop)
+        workers[1].join()
+    finally:
+        # Unblock and wait for the workers if we are leaving early
+        if workers[1].is_alive():
+            stop.set()
+        for worker in workers:
+            worker.join()
+        if sink is not None:
+            sink.close()
+    
+    if errors:
+        raise errors[0]
         
     return {
         'angles': angles_data,
@@ -0,0 +1,18 @@
+"""
+Optional Numba support.
+
+Exposes `njit` from Numba when it is installed, otherwise a no-op
+decorator so JIT kernels still run as plain Python.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -3,9 +3,10 @@ Video I/O utility module for reading and writing video files
 """
 
 import cv2
+import math
 import numpy as np
 from pathlib import Path
-from typing import List, Generator
+from typing import List, Generator, Optional, Tuple, Union
 
 def validate_video_file(path: str) -> bool:
     """Takes in a video file path and verifies that it exists and is openable
@@ -38,10 +39,60 @@ def read_video(path: str) -> cv2.VideoCapture:
         VideoCapture: cv2 VideoCapture object
     """
     
-    if not validate_video_file(path):
+    # Open once and check that, rather than validate_video_file() opening it too
+    if not Path(path).exists():
+        raise FileNotFoundError('File does not exist or is not openable')
+    cap = open_video_capture(path)
+    if not cap.isOpened():
+        cap.release()
         raise FileNotFoundError('File does not exist or is not openable')
     
-    return cv2.VideoCapture(path)
+    return cap
+
+
+def open_video(path: str) -> Tuple[cv2.VideoCapture, dict]:
+    """Opens the video at the input file path and reads its parameters
+
+    Use instead of get_video_info() followed by read_video(), which would
+    open (and parse the container of) the file twice.
+
+    Args:
+        path (str): File path of the video to be opened
+
+    Returns:
+        Tuple[VideoCapture, dict]: Opened capture (caller must release it)
+        and the same parameters as get_capture_info()
+    """
+    
+    cap = read_video(path)
+    
+    return cap, get_capture_info(cap)
+
+
+def open_video_capture(path: str) -> cv2.VideoCapture:
+    """Opens a VideoCapture, preferring a hardware-accelerated decoder
+
+    Asks the FFmpeg backend for any available hardware decoder (NVDEC,
+    VAAPI, VideoToolbox, ...). If the backend or build does not support
+    that, falls back to the default capture. Frames are returned as BGR
+    numpy arrays either way.
+
+    Args:
+        path (str): File path of the video to be opened
+
+    Returns:
+        VideoCapture: cv2 VideoCapture object
+    """
+    
+    cap = cv2.VideoCapture(
+        path, cv2.CAP_FFMPEG,
+        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+    )
+    if not cap.isOpened():
+        cap.release()
+        cap = cv2.VideoCapture(path)
+    
+    return cap
     
     
 def get_video_info(path: str) -> dict:
@@ -56,6 +107,22 @@ def get_video_info(path: str) -> dict:
     
     cap = read_video(path)
     
+    try:
+        return get_capture_info(cap)
+    finally:
+        cap.release()
+    
+    
+def get_capture_info(cap: cv2.VideoCapture) -> dict:
+    """Returns relevant parameters of an already opened video
+
+    Args:
+        cap (VideoCapture): Opened cv2 VideoCapture object
+
+    Returns:
+        dict: Dictionary containing the relevant parameters of the video
+    """
+    
     vid_info = {}
     
     # Store fps, height, width, frame_count, and duration of video
@@ -70,8 +137,6 @@ def get_video_info(path: str) -> dict:
     else:
         vid_info['duration'] = 0.0
     
-    cap.release()
-    
     return vid_info
     
     
@@ -89,66 +154,199 @@ def iterate_frames(path: str, frame_skip: int = 0) -> Generator[np.ndarray, None
         raise ValueError(f"frame_skip must be non-negative, got {frame_skip}")
     
     cap = read_video(path)
-    frame_counter = 0
     
     try:
-        while True:
-            success, frame = cap.read()        
-            if not success:
-                break
-            
-            if frame_counter % (frame_skip + 1) == 0:
-                yield frame
-            
-            frame_counter += 1
+        yield from iterate_capture(cap, frame_skip)
     finally:
         cap.release()
 
-def extract_frames(path: str, frame_skip: int = 0) -> List[np.ndarray]:
-    """Extracts all frames from video file path
+
+def iterate_capture(cap: cv2.VideoCapture, frame_skip: int = 0) -> Generator[np.ndarray, None, None]:
+    """Generator that yields frames one at a time from an opened video
+
+    Reads from the capture's current position and does not release it,
+    so the caller can rewind (CAP_PROP_POS_FRAMES) and iterate again.
+
+    Args:
+        cap (VideoCapture): Opened cv2 VideoCapture object
+        frame_skip (int): Number of frames to skip
+
+    Yields:
+        np.ndarray: Video frame as numpy array (height, width, channels)
+    """
+    if frame_skip < 0:
+        raise ValueError(f"frame_skip must be non-negative, got {frame_skip}")
+    
+    frame_counter = 0
+    
+    while True:
+        # grab() only advances the stream, skipped frames are never decoded
+        if not cap.grab():
+            break
+        
+        if frame_counter % (frame_skip + 1) == 0:
+            success, frame = cap.retrieve()
+            if not success:
+                break
+            yield frame
+        
+        frame_counter += 1
+
+def extract_frames(path: str, frame_skip: int = 0, dtype: np.dtype = np.uint8) -> np.ndarray:
+    """Extracts all frames from video file path into one array
+
+    Allocates a single (N, height, width, channels) array sized from the
+    container's frame count and fills it in place, growing it only if the
+    container under-reports its length. Raises ValueError if the video has
+    no decodable frames.
 
     WARNING: Loads entire video into memory. For large videos, use
     iterate_frames() instead to process frames one at a time.
     Args:
         path (str): Video file path
         frame_skip (int): Number of frames to skip
+        dtype (np.dtype): Data type of the returned array (default: uint8)
 
     Returns:
-        List[np.ndarray]: Extracted list of frames from video
+        np.ndarray: Extracted frames, shape (N, height, width, channels)
     """
+    if frame_skip < 0:
+        raise ValueError(f"frame_skip must be non-negative, got {frame_skip}")
+    
+    cap, info = open_video(path)
+    
+    try:
+        frame_count = info['frame_count']
+        expected = max(math.ceil(frame_count / (frame_skip + 1)), 1)
+        
+        frames = None
+        n = 0
+        for frame in iterate_capture(cap, frame_skip):
+            if frames is None:
+                frames = np.empty((expected, *frame.shape), dtype=dtype)
+            elif n == len(frames):
+                frames = np.concatenate([frames, np.empty_like(frames)])
+            frames[n] = frame
+            n += 1
+    finally:
+        cap.release()
+    
+    if frames is None:
+        raise ValueError(f"No decodable frames in video: {path}")
     
-    return list(iterate_frames(path, frame_skip))
+    return frames[:n]
     
     
-def write_video(path: str, frames: List[np.ndarray], fps: int, codec: str = "mp4v") -> None:
+def write_video(path: str, frames: Union[List[np.ndarray], np.ndarray], fps: int, codec: str = "mp4v") -> None:
     """Writes the input frames to a new video file
 
     Args:
         path (str): Name of output file
-        frames (List[np.ndarray]): Frames to be written into the video (all must be same size)
+        frames (Union[List[np.ndarray], np.ndarray]): Frames to be written into the video
+            (all must be same size), e.g. a list or the (N, height, width, channels)
+            array returned by extract_frames()
         fps (int): Frames per second desired
         codec (str): Four-character codec code (default: 'mp4v')
     """
-    if not frames:
+    if len(frames) == 0:
         raise ValueError("Frame list is empty")
-    # Check all frames are the same shape
-    frame_shapes = [frame.shape[:2] for frame in frames]
-    if len(set(frame_shapes)) > 1:
-        raise ValueError("Not all frames are the same size")
-    
-    # Get height and width of frames
-    height, width = frames[0].shape[:2]
     
+    with VideoSink(path, fps, codec=codec) as sink:
+        for frame in frames:
+            sink.write(frame)
+
+
+class VideoSink:
+    """Streams frames to a video file one at a time
+
+    Keeps only the current frame in memory instead of a list of the whole
+    video. Use as a context manager or call close() when done.
+
+    Args:
+        path (str): Name of output file
+        fps (int): Frames per second desired
+        size (Optional[tuple]): Frame size as (width, height). If None, taken
+            from the first frame written, and no file is created until then.
+        codec (str): Four-character codec code (default: 'mp4v')
+    """
+
+    def __init__(self, path: str, fps: int, size: Optional[tuple] = None, codec: str = "mp4v"):
+        self.path = path
+        self.fps = fps
+        self.size = size
+        self.codec = codec
+        self._writer = None
+        self.frames_written = 0
+        
+        if size is not None:
+            self._writer = open_video_writer(path, fps, size, codec)
+
+    def write(self, frame: np.ndarray) -> None:
+        """Writes one frame to the video
+
+        Args:
+            frame (np.ndarray): BGR frame matching the sink's size
+        """
+        height, width = frame.shape[:2]
+        
+        if self._writer is None:
+            self.size = (width, height)
+            self._writer = open_video_writer(self.path, self.fps, self.size, self.codec)
+        elif (width, height) != self.size:
+            # VideoWriter silently drops frames of the wrong size
+            raise ValueError(
+                f"Not all frames are the same size: frame {self.frames_written} is "
+                f"{width}x{height}, expected {self.size[0]}x{self.size[1]}"
+            )
+        
+        self._writer.write(frame)
+        self.frames_written += 1
+
+    def close(self) -> None:
+        """Finishes the file. Safe to call more than once."""
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
+
+    def __enter__(self) -> "VideoSink":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def open_video_writer(path: str, fps: int, size: tuple, codec: str = "mp4v") -> cv2.VideoWriter:
+    """Opens a VideoWriter, preferring a hardware-accelerated encoder
+
+    Asks the FFmpeg backend for any available hardware encoder for the
+    codec (NVENC, VAAPI, VideoToolbox, ...). If the backend or build does
+    not support that, falls back to the default software writer.
+
+    Hardware encoders only exist for codecs such as 'avc1' (H.264) and
+    'hevc'; with the default 'mp4v' the software encoder is always used.
+
+    Args:
+        path (str): Name of output file
+        fps (int): Frames per second desired
+        size (tuple): Frame size as (width, height)
+        codec (str): Four-character codec code (default: 'mp4v')
+
+    Returns:
+        VideoWriter: Opened cv2 VideoWriter object
+    """
     # Create fourcc code
     fourcc = cv2.VideoWriter_fourcc(*codec)
-    # Create VideoWriter
+    
     # Note: dimensions are (width, height) not (height, width)
-    out = cv2.VideoWriter(path, fourcc, fps, (width, height))
+    out = cv2.VideoWriter(
+        path, cv2.CAP_FFMPEG, fourcc, fps, size,
+        [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+    )
+    if not out.isOpened():
+        out.release()
+        out = cv2.VideoWriter(path, fourcc, fps, size)
     
     if not out.isOpened():
         raise IOError(f"Failed to create video file: {path}")
     
-    for frame in frames:
-        out.write(frame)
-    
-    out.release()
\ No newline at end of file
+    return out
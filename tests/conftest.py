@@ -0,0 +1,71 @@
+"""
+Shared pytest fixtures.
+
+Heavy resources (MediaPipe graph, video decoder) are created once per
+test session and reused by every test that needs them.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+TEST_IMAGE_PATH = DATA_DIR / 'test_images' / 'squat.jpeg'
+TEST_VIDEO_PATH = DATA_DIR / 'videos' / 'good_form' / 'squat.mp4'
+
+
+def pytest_configure(config):
+    """Register markers used without their plugin installed."""
+    # Provided by pytest-xdist; registered here so runs without it stay warning-free
+    config.addinivalue_line(
+        'markers', 'xdist_group(name): run tests with the same name on one xdist worker'
+    )
+
+
+# Seed for every randomized test, so failures reproduce
+RANDOM_SEED = 0
+
+
+@pytest.fixture
+def rng():
+    """Freshly seeded NumPy generator, independent of test order."""
+    return np.random.default_rng(RANDOM_SEED)
+
+
+@pytest.fixture(scope='session')
+def test_image_path():
+    """Path to the sample squat image."""
+    return TEST_IMAGE_PATH
+
+
+@pytest.fixture(scope='session')
+def pose_detector():
+    """Single PoseDetector (one MediaPipe graph) shared by the session."""
+    pytest.importorskip('mediapipe')
+    from src.pose.detector import PoseDetector
+
+    detector = PoseDetector()
+    yield detector
+    detector.close()
+
+
+@pytest.fixture(scope='session')
+def _video_cap_session():
+    """Video opened once per session, skipped if the sample video is absent."""
+    if not TEST_VIDEO_PATH.exists():
+        pytest.skip(f'Sample video not found at {TEST_VIDEO_PATH}')
+    from src.utils.video_io import read_video
+
+    cap = read_video(str(TEST_VIDEO_PATH))
+    yield cap
+    cap.release()
+
+
+@pytest.fixture
+def video_cap(_video_cap_session):
+    """Shared video capture, rewound to the first frame for each test."""
+    import cv2
+
+    _video_cap_session.set(cv2.CAP_PROP_POS_FRAMES, 0)
+    return _video_cap_session
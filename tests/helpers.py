@@ -0,0 +1,8 @@
+"""
+Assertion helpers shared by the unit tests.
+"""
+
+
+def approx_eq(actual: float, expected: float, tol: float = 0.1):
+    """Assert two scalars are within an absolute tolerance."""
+    assert abs(actual - expected) < tol, f'{actual} !≈ {expected} (tol {tol})'
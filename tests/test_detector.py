@@ -0,0 +1,41 @@
+"""
+Tests for PoseDetector on the sample image and video.
+
+Uses the session-scoped fixtures from conftest.py so the MediaPipe graph
+and the video decoder are only initialized once.
+"""
+
+import cv2
+
+
+class TestPoseDetector:
+    """Test suite for PoseDetector.detect."""
+
+    def test_image(self, pose_detector, test_image_path):
+        """Test pose detection on a single image."""
+        # Arrange: OpenCV loads BGR, MediaPipe expects RGB
+        image = cv2.imread(str(test_image_path))
+        assert image is not None
+        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+        # Act
+        result = pose_detector.detect(image_rgb)
+
+        # Assert: MediaPipe Pose returns 33 landmarks (x, y, z, visibility)
+        assert result is not None
+        assert result.landmarks.shape == (33, 4)
+        assert len(result.pose_landmarks.landmark) == 33
+
+    def test_video(self, pose_detector, video_cap):
+        """Test pose detection on the first 10 video frames."""
+        detected_count = 0
+        for _ in range(10):
+            success, frame = video_cap.read()
+            if not success:
+                break
+
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if pose_detector.detect(frame_rgb) is not None:
+                detected_count += 1
+
+        assert detected_count > 0
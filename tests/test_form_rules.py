@@ -0,0 +1,192 @@
+"""
+Unit tests for squat form rules.
+
+Tests the angle preprocessing helpers and rule checks with synthetic
+per-frame angle series.
+"""
+
+import pytest
+import numpy as np
+from src.analysis.form_rules import (
+    _filter_outliers,
+    _average_bilateral,
+    _spine_scan_numpy,
+    prepare_angles,
+    check_squat_depth,
+    check_hip_angle,
+    evaluate_form,
+)
+from src.analysis.form_rules_numba import _spine_scan
+from src.utils.numba_compat import NUMBA_AVAILABLE
+from tests.helpers import approx_eq
+
+NAN = float('nan')
+
+# Back angle series for the spine scan, with the (start, length) runs of
+# >20° frame-to-frame changes that are at least 2 changes long
+SPINE_SERIES = {
+    'run_at_min': ([0.0, 30.0, 0.0, 0.0], [(0, 2)]),
+    'run_below_min': ([0.0, 30.0, 30.0], []),
+    'run_at_end': ([0.0, 0.0, 30.0, 0.0], [(1, 2)]),
+    'nan_gap_splits_run': ([0.0, 30.0, NAN, 30.0, 0.0, 30.0], [(3, 2)]),
+    'all_nan': ([NAN, NAN, NAN], []),
+    'single_frame': ([5.0], []),
+}
+
+
+class TestFilterOutliers:
+    """Test suite for _filter_outliers helper."""
+
+    def test_spikes_removed_and_missing_preserved(self):
+        """Test extreme values become NaN while None stays missing."""
+        # Arrange: 20 steady frames with one glitch at each end and a gap
+        values = [90.0] * 20
+        values[0] = 5.0
+        values[-1] = 175.0
+        values[10] = None
+
+        # Act
+        filtered = _filter_outliers(values)
+
+        # Assert
+        assert np.isnan(filtered[0])
+        assert np.isnan(filtered[-1])
+        assert np.isnan(filtered[10])
+        approx_eq(filtered[5], 90.0, tol=1e-9)
+
+    def test_short_series_unchanged(self):
+        """Test fewer than 10 valid values are returned unfiltered."""
+        values = [10.0, 90.0, 170.0]
+
+        filtered = _filter_outliers(values)
+
+        assert filtered.tolist() == values
+
+
+class TestAverageBilateral:
+    """Test suite for _average_bilateral helper."""
+
+    def test_falls_back_to_available_side(self):
+        """Test averaging uses whichever side is present in each frame."""
+        left = np.array([80.0, np.nan, 100.0, np.nan])
+        right = np.array([100.0, 90.0, np.nan, np.nan])
+
+        averaged = _average_bilateral(left, right)
+
+        assert averaged[:3].tolist() == [90.0, 90.0, 100.0]
+        assert np.isnan(averaged[3])
+
+
+class TestPrepareAngles:
+    """Test suite for prepare_angles shared preprocessing."""
+
+    def test_reductions(self):
+        """Test knee minimum spans both sides and hip sides are averaged."""
+        angles = {
+            'knee_left': [120.0, 95.0, None],
+            'knee_right': [110.0, 100.0, 130.0],
+            'hip_left': [80.0, 70.0],
+            'hip_right': [100.0, 90.0],
+        }
+
+        prep = prepare_angles(angles)
+
+        approx_eq(prep.knee_min, 95.0, tol=1e-9)
+        assert prep.hip.tolist() == [90.0, 80.0]
+        approx_eq(prep.hip_min, 80.0, tol=1e-9)
+        assert prep.back.size == 0
+
+    def test_missing_angles_are_nan(self):
+        """Test reductions are NaN when no values were measured."""
+        prep = prepare_angles({'knee_left': [None, None]})
+
+        assert np.isnan(prep.knee_min)
+        assert np.isnan(prep.hip_min)
+
+
+class TestSpineScan:
+    """Test suite for the spine neutral run detection."""
+
+    @pytest.mark.parametrize('case', SPINE_SERIES)
+    def test_runs(self, case):
+        """Test runs shorter than min_consecutive or broken by NaN are dropped."""
+        series, expected_runs = SPINE_SERIES[case]
+
+        run_starts, run_lengths, _, _, _ = _spine_scan_numpy(np.array(series), 20, 2)
+
+        assert list(zip(run_starts.tolist(), run_lengths.tolist())) == expected_runs
+
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason='Numba not installed')
+    @pytest.mark.parametrize('case', SPINE_SERIES)
+    def test_kernel_matches_numpy(self, case):
+        """Test the compiled kernel returns exactly what the NumPy version does."""
+        back_angles = np.array(SPINE_SERIES[case][0])
+
+        expected = _spine_scan_numpy(back_angles, 20, 2)
+        actual = _spine_scan(back_angles, 20, 2)
+
+        for actual_part, expected_part in zip(actual, expected):
+            np.testing.assert_array_equal(actual_part, expected_part)
+
+
+class TestZoneBoundaries:
+    """Test threshold edges land in the zone the original if/elif chains chose."""
+
+    @pytest.mark.parametrize('min_knee, expected', [
+        (39.9, 'depth_excessive'),
+        (40.0, 'depth_deep'),
+        (59.9, 'depth_deep'),
+        (60.0, 'depth_ideal'),
+        (100.0, 'depth_ideal'),
+        (100.1, 'depth_shallow'),
+        (120.0, 'depth_shallow'),
+        (120.1, 'depth_very_shallow'),
+    ])
+    def test_depth_zone(self, min_knee, expected):
+        """Test knee angles at and around each depth threshold."""
+        violations = check_squat_depth({'knee_left': [min_knee]})
+
+        assert [v.rule_name for v in violations] == [expected]
+
+    @pytest.mark.parametrize('min_hip, expected', [
+        (39.9, 'hip_angle_excessive'),
+        (40.0, 'hip_angle_deep'),
+        (59.9, 'hip_angle_deep'),
+        (60.0, None),
+        (69.9, None),
+        (70.0, 'hip_angle_good'),
+    ])
+    def test_hip_zone(self, min_hip, expected):
+        """Test hip angles at and around each hip threshold (None = nothing reported)."""
+        violations = check_hip_angle({'hip_left': [min_hip], 'hip_right': [min_hip]})
+
+        assert [v.rule_name for v in violations] == ([expected] if expected else [])
+
+
+class TestEvaluateForm:
+    """Test suite for evaluate_form entry point."""
+
+    def test_ideal_depth_passes(self):
+        """Test a squat reaching ~90° knee angle is reported as ideal depth."""
+        # Arrange: knee goes 170° -> 90° -> 170°, everything else steady
+        knee = list(np.linspace(170, 90, 15)) + list(np.linspace(90, 170, 15))
+        angles = {
+            'knee_left': knee,
+            'knee_right': knee,
+            'hip_left': [100.0] * 30,
+            'hip_right': [100.0] * 30,
+            'back_left': [170.0] * 30,
+            'back_right': [170.0] * 30,
+        }
+
+        # Act
+        violations = evaluate_form(angles)
+
+        # Assert
+        rule_names = {v.rule_name for v in violations}
+        assert 'depth_ideal' in rule_names
+        assert all(v.passed for v in violations)
+
+    def test_empty_angles(self):
+        """Test no angle data produces no violations."""
+        assert evaluate_form({}) == []
@@ -0,0 +1,69 @@
+"""
+Property-based tests for geometry calculations.
+
+Draws batches of random (a, b, c) triples with Hypothesis and checks
+invariants of the angle calculation in vectorized NumPy passes.
+"""
+
+import pytest
+import numpy as np
+
+pytest.importorskip('hypothesis')
+from hypothesis import given, settings, strategies as st
+from hypothesis.extra.numpy import arrays
+
+from src.features.geometry import calculate_angle, calculate_angles_batch
+from tests.test_geometry import as_points
+
+BATCH_SIZE = 1000
+COORDS = st.floats(-10, 10, allow_nan=False, allow_infinity=False, allow_subnormal=False)
+# Angles near 0° and 180° are ill-conditioned, so compare in degrees with some slack
+ATOL = 1e-3
+
+
+def well_conditioned(points: np.ndarray) -> np.ndarray:
+    """Mask of rows whose BA and BC vectors are not (nearly) zero-length."""
+    ba = np.linalg.norm(points[:, 0] - points[:, 1], axis=-1)
+    bc = np.linalg.norm(points[:, 2] - points[:, 1], axis=-1)
+    return (ba >= 1e-3) & (bc >= 1e-3)
+
+
+@settings(max_examples=5, deadline=None)
+@given(points=arrays(np.float64, (BATCH_SIZE, 3, 3), elements=COORDS))
+def test_bounds_and_symmetry(points):
+    """Test angles stay in [0, 180] and do not depend on the order of A and C."""
+    angles = calculate_angles_batch(points[:, 0], points[:, 1], points[:, 2])
+    reversed_angles = calculate_angles_batch(points[:, 2], points[:, 1], points[:, 0])
+
+    valid = angles[~np.isnan(angles)]
+    assert ((valid >= 0) & (valid <= 180)).all()
+    np.testing.assert_allclose(angles, reversed_angles, atol=ATOL)
+
+
+@settings(max_examples=5, deadline=None)
+@given(
+    points=arrays(np.float64, (BATCH_SIZE, 3, 3), elements=COORDS),
+    shift=arrays(np.float64, 3, elements=st.integers(-5, 5).map(float)),
+)
+def test_translation_invariance(points, shift):
+    """Test moving all three points by the same offset keeps the angle."""
+    mask = well_conditioned(points)
+    points = points[mask]
+    shifted = points + shift
+
+    angles = calculate_angles_batch(points[:, 0], points[:, 1], points[:, 2])
+    shifted_angles = calculate_angles_batch(shifted[:, 0], shifted[:, 1], shifted[:, 2])
+
+    np.testing.assert_allclose(angles, shifted_angles, atol=ATOL)
+
+
+@settings(max_examples=5, deadline=None)
+@given(points=arrays(np.float64, (BATCH_SIZE, 3, 3), elements=COORDS))
+def test_scalar_matches_batch(points):
+    """Test calculate_angle agrees with calculate_angles_batch row by row."""
+    points = points[well_conditioned(points)]
+
+    expected = calculate_angles_batch(points[:, 0], points[:, 1], points[:, 2])
+    angles = np.array([calculate_angle(*as_points(row)) for row in points])
+
+    np.testing.assert_allclose(angles, expected, atol=ATOL)
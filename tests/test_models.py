@@ -0,0 +1,126 @@
+"""
+Unit tests for form analysis data models.
+
+Tests ViolationTable columns and FormResult's derived pass/fail state and
+cached violation views.
+"""
+
+import dataclasses
+
+import pytest
+from src.analysis.models import PASSING_SCORE, FormResult, FormViolation, Severity, ViolationTable
+
+
+def make_violation(severity: Severity, passed: bool = False) -> FormViolation:
+    """Build a minimal violation of the given severity."""
+    return FormViolation(
+        rule_name=f'{severity.label}_rule',
+        severity=severity,
+        passed=passed,
+        score_penalty=0 if passed else 10,
+        feedback='' if passed else f'{severity.label} issue',
+    )
+
+
+class TestViolationTable:
+    """Test suite for ViolationTable."""
+
+    def test_from_list_columns(self):
+        """Test each violation field lands in its own column, in order."""
+        violations = [make_violation(Severity.CRITICAL), make_violation(Severity.LOW, passed=True)]
+
+        table = ViolationTable.from_list(violations)
+
+        assert len(table) == 2
+        assert table.passed.tolist() == [False, True]
+        assert table.severity.tolist() == [Severity.CRITICAL, Severity.LOW]
+        assert table.penalty.tolist() == [10, 0]
+        assert table.feedback.tolist() == ['critical issue', '']
+
+    def test_failed_indices(self):
+        """Test only rows that failed are returned."""
+        table = ViolationTable.from_list([
+            make_violation(Severity.HIGH, passed=True),
+            make_violation(Severity.HIGH),
+            make_violation(Severity.LOW),
+        ])
+
+        assert table.failed_indices().tolist() == [1, 2]
+
+    @pytest.mark.parametrize('passed, expected', [(False, True), (True, False)])
+    def test_has_critical_needs_a_failure(self, passed, expected):
+        """Test a critical row only counts when it failed."""
+        table = ViolationTable.from_list([
+            make_violation(Severity.HIGH),
+            make_violation(Severity.CRITICAL, passed=passed),
+        ])
+
+        assert table.has_critical() is expected
+
+    def test_empty(self):
+        """Test an empty list gives an empty table without critical issues."""
+        table = ViolationTable.from_list([])
+
+        assert len(table) == 0
+        assert not table.has_critical()
+
+
+class TestFormResult:
+    """Test suite for FormResult."""
+
+    @pytest.mark.parametrize('score, severity, expected', [
+        (PASSING_SCORE, Severity.LOW, True),
+        (PASSING_SCORE - 1, Severity.LOW, False),
+        (100, Severity.CRITICAL, False),
+    ], ids=('at_threshold', 'below_threshold', 'critical_failure'))
+    def test_passed(self, score, severity, expected):
+        """Test passed needs the passing score and no failed critical violation."""
+        result = FormResult(score, [make_violation(severity)], [])
+
+        assert result.passed is expected
+
+    def test_passed_critical_check_ignores_passing_violations(self):
+        """Test a critical rule that passed does not fail the result."""
+        result = FormResult(100, [make_violation(Severity.CRITICAL, passed=True)], [])
+
+        assert result.passed
+        assert result.get_critical_violations() == []
+
+    def test_violations_coerced_to_tuple(self):
+        """Test any violation sequence is stored as a tuple."""
+        violations = [make_violation(Severity.HIGH)]
+
+        result = FormResult(90, violations, [])
+
+        assert result.violations == tuple(violations)
+        with pytest.raises(AttributeError):
+            result.violations.append(make_violation(Severity.CRITICAL))
+
+    def test_reassigning_violations_resets_caches(self):
+        """Test cached views are rebuilt after violations is replaced."""
+        # Arrange: populate every cache with a clean result
+        result = FormResult(90, [make_violation(Severity.LOW, passed=True)], [])
+        assert result.passed
+        assert len(result.table) == 1
+        assert result.get_failed_violations() == []
+
+        # Act
+        critical = make_violation(Severity.CRITICAL)
+        result.violations = [critical]
+
+        # Assert
+        assert isinstance(result.violations, tuple)
+        assert not result.passed
+        assert result.get_critical_violations() == [critical]
+        assert result.get_failed_violations() == [critical]
+        assert result.table.severity.tolist() == [Severity.CRITICAL]
+
+    def test_caches_are_not_dataclass_fields(self):
+        """Test asdict() and fields() only see the public attributes."""
+        result = FormResult(90, [make_violation(Severity.HIGH)], [])
+        result.table
+
+        assert [f.name for f in dataclasses.fields(result)] == [
+            'score', 'violations', 'feedback_summary', 'details'
+        ]
+        assert set(dataclasses.asdict(result)) == {'score', 'violations', 'feedback_summary', 'details'}
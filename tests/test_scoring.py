@@ -0,0 +1,87 @@
+"""
+Unit tests for form scoring.
+
+Tests calculate_score and get_violation_summary on a mixed-severity
+violation list, through both the Numba kernel and the NumPy fallback.
+"""
+
+import pytest
+from src.analysis import scoring
+from src.analysis.models import FormViolation, Severity, ViolationTable
+from src.utils.numba_compat import NUMBA_AVAILABLE
+
+# (severity, passed, score_penalty)
+MIXED_VIOLATIONS = [
+    (Severity.CRITICAL, False, 30),  # -45.0
+    (Severity.HIGH, False, 15),      # -18.0
+    (Severity.MEDIUM, False, 10),    # -10.0
+    (Severity.LOW, False, 5),        # -2.5
+    (Severity.HIGH, True, 0),
+    (Severity.LOW, True, 0),
+]
+
+
+def make_violations(rows):
+    """Build FormViolations from (severity, passed, score_penalty) rows."""
+    return [
+        FormViolation(
+            rule_name=f'rule_{i}',
+            severity=severity,
+            passed=passed,
+            score_penalty=penalty,
+            feedback='' if passed else f'issue {i}',
+        )
+        for i, (severity, passed, penalty) in enumerate(rows)
+    ]
+
+
+@pytest.fixture(params=[
+    pytest.param(True, id='numba', marks=pytest.mark.skipif(not NUMBA_AVAILABLE, reason='Numba not installed')),
+    pytest.param(False, id='numpy'),
+])
+def use_numba(request, monkeypatch):
+    """Run the test once through the Numba kernel and once through the NumPy fallback."""
+    monkeypatch.setattr(scoring, 'NUMBA_AVAILABLE', request.param)
+    return request.param
+
+
+class TestCalculateScore:
+    """Test suite for calculate_score."""
+
+    def test_mixed_severities(self, use_numba):
+        """Test weighted penalties of failed rules only are deducted from 100."""
+        # 100 - 45 - 18 - 10 - 2.5 = 24.5, truncated
+        assert scoring.calculate_score(make_violations(MIXED_VIOLATIONS)) == 24
+
+    def test_table_input_matches_list(self, use_numba):
+        """Test a prebuilt ViolationTable scores the same as the list."""
+        violations = make_violations(MIXED_VIOLATIONS)
+
+        assert scoring.calculate_score(ViolationTable.from_list(violations)) == scoring.calculate_score(violations)
+
+    def test_clamped_at_zero(self, use_numba):
+        """Test deductions past 100 clamp the score to 0."""
+        violations = make_violations([(Severity.CRITICAL, False, 100)] * 2)
+
+        assert scoring.calculate_score(violations) == 0
+
+    def test_no_violations(self, use_numba):
+        """Test an empty list scores a perfect 100."""
+        assert scoring.calculate_score([]) == 100
+
+
+class TestViolationSummary:
+    """Test suite for get_violation_summary."""
+
+    def test_mixed_severities(self):
+        """Test failed violations are counted per severity and passes separately."""
+        summary = scoring.get_violation_summary(make_violations(MIXED_VIOLATIONS))
+
+        assert summary == {
+            'total': 6,
+            'critical': 1,
+            'high': 1,
+            'medium': 1,
+            'low': 1,
+            'passed': 2,
+        }
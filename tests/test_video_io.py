@@ -0,0 +1,53 @@
+"""
+Unit tests for video I/O helpers.
+
+Tests extract_frames and write_video on a small synthetic video.
+"""
+
+import numpy as np
+import pytest
+from src.utils.video_io import VideoSink, extract_frames, write_video
+
+N_FRAMES = 5
+FRAME_SHAPE = (48, 64, 3)
+
+
+@pytest.fixture
+def video_path(tmp_path):
+    """Short solid-color video written to a temporary file."""
+    path = str(tmp_path / 'input.mp4')
+    with VideoSink(path, fps=10) as sink:
+        for i in range(N_FRAMES):
+            sink.write(np.full(FRAME_SHAPE, i * 40, dtype=np.uint8))
+    return path
+
+
+class TestExtractFrames:
+    """Test suite for extract_frames function."""
+
+    def test_returns_one_array(self, video_path):
+        """Test every frame lands in a single (N, height, width, channels) array."""
+        frames = extract_frames(video_path)
+
+        assert frames.shape == (N_FRAMES, *FRAME_SHAPE)
+
+    def test_output_can_be_written_back(self, video_path, tmp_path):
+        """Test the extracted array is accepted by write_video as-is."""
+        # Arrange
+        frames = extract_frames(video_path)
+        output_path = str(tmp_path / 'output.mp4')
+
+        # Act
+        write_video(output_path, frames, fps=10)
+
+        # Assert
+        assert extract_frames(output_path).shape == frames.shape
+
+
+class TestWriteVideo:
+    """Test suite for write_video function."""
+
+    def test_empty_array_raises(self, tmp_path):
+        """Test an empty frame array is rejected like an empty list."""
+        with pytest.raises(ValueError, match='empty'):
+            write_video(str(tmp_path / 'output.mp4'), np.empty((0, *FRAME_SHAPE), np.uint8), fps=10)